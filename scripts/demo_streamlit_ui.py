@@ -62,7 +62,7 @@ def show_instructions():
     print("="*60)
     
     print("\n📋 Prerequisites:")
-    print("   1. Python 3.8+ installed")
+    print("   1. Python 3.11+ installed")
     print("   2. Streamlit installed (pip install streamlit)")
     print("   3. ZeroRAG API server running on port 8000")
     print("   4. All project dependencies installed")
@@ -62,7 +62,7 @@ def validate_configuration():
         # Document processing
         print(f"\n📄 Document Processing:")
         print(f"   Max File Size: {config.document.max_file_size}")
-        print(f"   Supported Formats: {', '.join(config.document.supported_formats)}")
+        print(f"   Supported Formats: {', '.join(sorted(config.document.supported_formats))}")
         print(f"   Chunk Size: {config.document.chunk_size}")
         print(f"   Chunk Overlap: {config.document.chunk_overlap}")
         
@@ -80,7 +80,7 @@ class FileValidator:
     
     def __init__(self):
         self.supported_formats = config.document.supported_formats
-        self.max_file_size = self._parse_file_size(config.document.max_file_size)
+        self.max_file_size = config.document.max_file_size_bytes
         
         # File type signatures (magic bytes)
         self.file_signatures = {
@@ -101,17 +101,6 @@ class FileValidator:
             'application/json': ['json'],
         }
     
-    def _parse_file_size(self, size_str: str) -> int:
-        """Parse file size string to bytes."""
-        if size_str.endswith("MB"):
-            return int(size_str[:-2]) * 1024 * 1024
-        elif size_str.endswith("KB"):
-            return int(size_str[:-2]) * 1024
-        elif size_str.endswith("B"):
-            return int(size_str[:-1])
-        else:
-            return int(size_str)
-    
     def validate_file(self, filename: str, file_size: int, content_type: Optional[str] = None) -> Dict[str, Any]:
         """Validate file before upload."""
         errors = []
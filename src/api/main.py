@@ -31,14 +31,17 @@ from pathlib import Path
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 from ..config import get_config
-from ..services.service_factory import ServiceFactory
+from ..services.service_factory import ServiceFactory, shutdown_service_factory
 from .advanced_features import stream_manager
 from .models import ErrorResponse, APIInfo
-from .routes import health_router, documents_router, query_router, metrics_router, advanced_router
+from .routes import (
+    health_router, documents_router, query_router, metrics_router, advanced_router,
+    shutdown_embedding_pool
+)
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +134,7 @@ See the interactive documentation at `/docs` for detailed examples and testing.
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     contact={
         "name": "ZeroRAG API Support",
         "url": "https://github.com/your-repo/zero-rag",
@@ -283,6 +287,14 @@ async def shutdown_event():
     if stream_manager._cleanup_task and not stream_manager._cleanup_task.done():
         stream_manager._cleanup_task.cancel()
         logger.info("Cancelled streaming connection cleanup task")
+    
+    # Stop embedding worker processes
+    shutdown_embedding_pool()
+    logger.info("Shut down embedding process pool")
+    
+    # Release the shared services used by the routes
+    shutdown_service_factory()
+    logger.info("Shut down service factory")
 
 
 # Main entry point
@@ -4,26 +4,38 @@ ZeroRAG API Routes
 This module contains all the API route handlers organized by functionality.
 """
 
+import asyncio
 import logging
+import os
 import time
 import json
+import multiprocessing
 import uuid
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional, Dict, Any, Generator
 from pathlib import Path
 
+import aiofiles.os
 from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, BackgroundTasks, Request
 from fastapi.responses import StreamingResponse
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.models import PayloadSelectorInclude
 
 try:
     from ..config import get_config
-    from ..services.service_factory import ServiceFactory
+    from ..services.service_factory import ServiceFactory, get_service_factory as get_shared_service_factory
+    from ..services.rag_pipeline import RAGQuery
+    from ..models.embeddings import EmbeddingService
     from .advanced_features import (
         file_validator, upload_tracker, stream_manager, cleanup_manager,
         ProcessingStep, FileValidationError
     )
 except ImportError:
     from config import get_config
-    from services.service_factory import ServiceFactory
+    from services.service_factory import ServiceFactory, get_service_factory as get_shared_service_factory
+    from services.rag_pipeline import RAGQuery
+    from models.embeddings import EmbeddingService
     from .advanced_features import (
         file_validator, upload_tracker, stream_manager, cleanup_manager,
         ProcessingStep, FileValidationError
@@ -40,6 +52,11 @@ logger = logging.getLogger(__name__)
 # Initialize configuration
 config = get_config()
 
+# Streaming responses are flushed once this many characters are buffered or
+# this many seconds have passed since the last flush, even between chunks
+STREAM_FLUSH_SIZE = 4096
+STREAM_FLUSH_INTERVAL = 0.02
+
 # Create routers
 health_router = APIRouter(prefix="/health", tags=["Health"])
 documents_router = APIRouter(prefix="/documents", tags=["Documents"])
@@ -48,10 +65,132 @@ metrics_router = APIRouter(prefix="/metrics", tags=["Metrics"])
 advanced_router = APIRouter(prefix="/advanced", tags=["Advanced Features"])
 
 
+# Lightweight Qdrant client used when the vector store service is unavailable
+_qdrant_client: Optional[AsyncQdrantClient] = None
+
+# Only the payload fields needed to group chunks into documents
+_DOCUMENT_LIST_PAYLOAD = PayloadSelectorInclude(
+    include=["source_file", "created_at", "updated_at", "metadata"]
+)
+
+# Process pool for document embedding, created on first upload
+_embedding_pool: Optional[ProcessPoolExecutor] = None
+
+# Embedding service owned by each pool worker process
+_worker_embedding_service: Optional[EmbeddingService] = None
+
+# Next filename suffix to try for recently uploaded paths, least recently
+# used first, guarded for concurrent uploads
+_upload_name_counters: "OrderedDict[Path, int]" = OrderedDict()
+_upload_name_lock = asyncio.Lock()
+
+# Number of upload paths whose next suffix is remembered
+UPLOAD_NAME_COUNTERS_SIZE = 1024
+
+
 # Dependency injection
 def get_service_factory() -> ServiceFactory:
-    """Get the service factory instance."""
-    return ServiceFactory()
+    """
+    Get the shared service factory instance.
+    
+    Every request uses the process-wide factory, so services, their health
+    check pool and the cached services snapshot are created once instead of
+    per request.
+    """
+    return get_shared_service_factory()
+
+
+async def _resolve_upload_path(base_path: Path) -> Path:
+    """
+    Pick a free upload path for a filename, appending _N to the stem on conflicts.
+    
+    The bare filename is used whenever it is free, e.g. after cleanup removed
+    the earlier upload. Otherwise the next suffix to try is remembered for
+    recently used filenames, so repeated uploads of the same name cost a
+    single further existence check instead of probing every earlier suffix.
+    The lock also stops concurrent uploads from claiming the same name.
+    """
+    async with _upload_name_lock:
+        # Non-blocking checks so slow mounts don't stall the event loop
+        if not await aiofiles.os.path.exists(base_path):
+            _upload_name_counters.pop(base_path, None)
+            return base_path
+        
+        counter = _upload_name_counters.pop(base_path, 1)
+        while True:
+            upload_path = base_path.with_name(f"{base_path.stem}_{counter}{base_path.suffix}")
+            if not await aiofiles.os.path.exists(upload_path):
+                break
+            counter += 1
+        
+        _upload_name_counters[base_path] = counter + 1
+        if len(_upload_name_counters) > UPLOAD_NAME_COUNTERS_SIZE:
+            _upload_name_counters.popitem(last=False)
+        return upload_path
+
+
+def _init_embedding_worker():
+    """Load the embedding model once in each pool worker process."""
+    global _worker_embedding_service
+    config.setup_worker_logging()
+    _worker_embedding_service = EmbeddingService()
+
+
+def _encode_batch(texts: List[str]):
+    """Encode texts with the worker's embedding service."""
+    return _worker_embedding_service.encode(texts)
+
+
+def _get_embedding_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared embedding process pool, creating it on first use.
+    
+    Workers are spawned rather than forked: forking a process that has
+    imported torch and runs client threads can deadlock the child. Every
+    worker loads its own copy of the embedding model, so the pool needs
+    about one model's memory per worker; EMBEDDING_WORKERS bounds it.
+    """
+    global _embedding_pool
+    if _embedding_pool is None:
+        _embedding_pool = ProcessPoolExecutor(
+            max_workers=min(config.ai_model.embedding_workers, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_embedding_worker
+        )
+    return _embedding_pool
+
+
+def shutdown_embedding_pool():
+    """Shut down the embedding process pool if it was started."""
+    global _embedding_pool
+    if _embedding_pool is not None:
+        _embedding_pool.shutdown(wait=False, cancel_futures=True)
+        _embedding_pool = None
+
+
+async def _encode_in_pool(texts: List[str]):
+    """
+    Encode document chunks in the embedding process pool.
+    
+    Embedding is CPU-bound, so running it in worker processes keeps the event
+    loop responsive and lets concurrent uploads embed in parallel instead of
+    serializing on the GIL.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_embedding_pool(), _encode_batch, texts)
+
+
+def _get_qdrant() -> AsyncQdrantClient:
+    """Get the shared async Qdrant client, creating it on first use."""
+    global _qdrant_client
+    if _qdrant_client is None:
+        _qdrant_client = AsyncQdrantClient(
+            host=config.database.qdrant_host,
+            port=config.database.qdrant_port,
+            api_key=config.database.qdrant_api_key,
+            timeout=10.0
+        )
+    return _qdrant_client
 
 
 # Health Routes
@@ -64,22 +203,26 @@ async def ping():
 async def health_check(service_factory: ServiceFactory = Depends(get_service_factory)):
     """Comprehensive health check endpoint."""
     try:
-        # Get service status
+        # Get service status, counting statuses in the same pass
         services_status = {}
+        status_counts = Counter()
         for service_name, service_info in service_factory.services.items():
+            status = service_info.status.value
+            status_counts[status] += 1
             services_status[service_name] = {
-                "status": service_info.status.value,
+                "status": status,
                 "last_check": service_info.last_check,
                 "error_count": service_info.error_count,
                 "health_data": service_info.health_data
             }
         
         # Determine overall status
-        overall_status = "healthy"
-        if any(s["status"] == "unhealthy" for s in services_status.values()):
-            overall_status = "degraded"
-        if any(s["status"] == "error" for s in services_status.values()):
+        if status_counts["error"]:
             overall_status = "unhealthy"
+        elif status_counts["unhealthy"]:
+            overall_status = "degraded"
+        else:
+            overall_status = "healthy"
         
         return HealthResponse(
             status=overall_status,
@@ -146,25 +289,15 @@ async def upload_document(
             )
         
         # Generate unique document ID
-        document_id = str(uuid.uuid4())
+        document_id = uuid.uuid4().hex
         
         # Create upload progress tracker
         await upload_tracker.create_upload(document_id, file.filename, file.size)
         
         # Save file with original filename (no UUID prefix)
         # Handle filename conflicts by appending a number if file already exists
-        base_path = Path(config.storage.upload_dir) / file.filename
-        upload_path = base_path
-        counter = 1
-        
-        while upload_path.exists():
-            # Split filename and extension
-            stem = base_path.stem
-            suffix = base_path.suffix
-            upload_path = base_path.parent / f"{stem}_{counter}{suffix}"
-            counter += 1
-        
-        upload_path.parent.mkdir(parents=True, exist_ok=True)
+        upload_path = await _resolve_upload_path(Path(config.storage.upload_dir) / file.filename)
+        await aiofiles.os.makedirs(upload_path.parent, exist_ok=True)
         
         with open(upload_path, "wb") as buffer:
             content = await file.read()
@@ -265,59 +398,52 @@ async def list_documents(
         if service_factory.vector_store:
             documents = service_factory.vector_store.list_documents(limit=limit, offset=offset)
         else:
-            # Create lightweight direct Qdrant connection for document listing only
-            from qdrant_client import QdrantClient
-            from ..config import get_config
+            # Reuse lightweight direct Qdrant connection for document listing only
+            client = _get_qdrant()
             
-            config = get_config()
-            client = QdrantClient(
-                host=config.database.qdrant_host,
-                port=config.database.qdrant_port,
-                api_key=config.database.qdrant_api_key,
-                timeout=10.0
-            )
-            
-            # Get documents directly from Qdrant
-            search_results = client.scroll(
+            # Get documents directly from Qdrant without blocking the event loop
+            search_results, _ = await client.scroll(
                 collection_name=config.database.qdrant_collection_name,
                 limit=limit,
                 offset=offset,
-                with_payload=True
-            )[0]
+                with_payload=_DOCUMENT_LIST_PAYLOAD,
+                with_vectors=False
+            )
             
-            # Group by source file
-            source_files = {}
+            # Group by source file in a single pass
+            source_files: Dict[str, Dict[str, Any]] = {}
             for point in search_results:
-                source_file = point.payload.get("source_file", "")
-                if source_file not in source_files:
-                    source_files[source_file] = {
+                payload = point.payload
+                source_file = payload.get("source_file", "")
+                doc = source_files.get(source_file)
+                if doc is None:
+                    source_files[source_file] = doc = {
                         "id": source_file,
                         "source_file": source_file,
                         "chunk_count": 0,
-                        "created_at": point.payload.get("created_at", ""),
-                        "updated_at": point.payload.get("updated_at", ""),
-                        "metadata": point.payload.get("metadata", {})
+                        "created_at": payload.get("created_at", ""),
+                        "updated_at": payload.get("updated_at", ""),
+                        "metadata": payload.get("metadata", {})
                     }
-                source_files[source_file]["chunk_count"] += 1
+                doc["chunk_count"] += 1
             
-            documents = list(source_files.values())
-        
-        # Format documents for response
-        formatted_documents = []
-        for doc in documents:
-            # Try to get document_id from metadata, fallback to source_file
-            metadata = doc.get("metadata", {})
-            document_id = metadata.get("document_id", doc.get("id", ""))
-            
-            formatted_documents.append({
-                "document_id": document_id,
+            documents = source_files.values()
+        
+        # Format documents for response; document_id comes from metadata,
+        # falling back to the source file
+        now = time.time()  # Upload time is not stored, use current time as fallback
+        formatted_documents = [
+            {
+                "document_id": doc.get("metadata", {}).get("document_id", doc.get("id", "")),
                 "filename": doc.get("source_file", "Unknown"),
                 "file_size": 0,  # Not available from vector store
-                "upload_timestamp": time.time(),  # Use current time as fallback
+                "upload_timestamp": now,
                 "chunks_count": doc.get("chunk_count", 0),
                 "status": "active",
                 "metadata": doc.get("metadata", {})
-            })
+            }
+            for doc in documents
+        ]
         
         return DocumentListResponse(
             documents=formatted_documents,
@@ -361,9 +487,6 @@ async def query(
         if not service_factory.rag_pipeline:
             raise HTTPException(status_code=503, detail="RAG pipeline not available")
         
-        # Create RAG query
-        from ..services.rag_pipeline import RAGQuery
-        
         # Prepare filters for document selection
         filters = None
         if request.document_ids:
@@ -395,11 +518,12 @@ async def query(
         sources = []
         if response.sources:
             for source in response.sources:
+                text_preview = source.get("text_preview", "")
                 sources.append({
                     "filename": source.get("file", "Unknown"),
                     "chunk_index": source.get("chunk_index", 0),
                     "relevance_score": source.get("score", 0.0),
-                    "content_preview": source.get("text_preview", "")[:200] + "..." if len(source.get("text_preview", "")) > 200 else source.get("text_preview", "")
+                    "content_preview": text_preview[:200] + "..." if len(text_preview) > 200 else text_preview
                 })
         
         return QueryResponse(
@@ -435,7 +559,7 @@ async def query_stream(
             raise HTTPException(status_code=503, detail="RAG pipeline not available")
         
         # Create connection ID
-        connection_id = str(uuid.uuid4())
+        connection_id = uuid.uuid4().hex
         
         # Create streaming connection
         await stream_manager.create_connection(
@@ -447,9 +571,6 @@ async def query_stream(
             }
         )
         
-        # Create RAG query
-        from ..services.rag_pipeline import RAGQuery
-        
         # Prepare filters for document selection
         filters = None
         if request.document_ids:
@@ -470,28 +591,60 @@ async def query_stream(
         
         async def generate_stream() -> Generator[str, None, None]:
             """Generate streaming response with connection management."""
+            # Coalesce events so each write to the socket carries several tokens
+            pending: List[str] = []
+            pending_size = 0
+            last_flush = time.monotonic()
             try:
                 # Update connection activity
                 await stream_manager.update_activity(connection_id)
                 
-                # Get streaming response from RAG pipeline
-                for chunk in service_factory.rag_pipeline.process_query_stream(rag_query):
-                    if chunk:
-                        # Update connection activity
+                # Get streaming response from RAG pipeline. Its generator blocks,
+                # so each chunk is pulled in a worker thread, leaving the event
+                # loop free to flush buffered events while the next one is pending
+                chunks = service_factory.rag_pipeline.process_query_stream(rag_query)
+                end_of_stream = object()
+                next_chunk = asyncio.ensure_future(asyncio.to_thread(next, chunks, end_of_stream))
+                while True:
+                    # Flush on time even when no further chunk arrives
+                    timeout = (
+                        max(0.0, STREAM_FLUSH_INTERVAL - (time.monotonic() - last_flush))
+                        if pending else None
+                    )
+                    done, _ = await asyncio.wait({next_chunk}, timeout=timeout)
+                    if done:
+                        chunk = next_chunk.result()
+                        if chunk is end_of_stream:
+                            break
+                        next_chunk = asyncio.ensure_future(asyncio.to_thread(next, chunks, end_of_stream))
+                        if not chunk:
+                            continue
+                        event = f"data: {json.dumps(chunk)}\n\n"
+                        pending.append(event)
+                        pending_size += len(event)
+                    
+                    now = time.monotonic()
+                    if pending and (pending_size >= STREAM_FLUSH_SIZE or now - last_flush >= STREAM_FLUSH_INTERVAL):
+                        # Update connection activity once per flush
                         await stream_manager.update_activity(connection_id)
                         
-                        # Send chunk
-                        yield f"data: {json.dumps(chunk)}\n\n"
+                        # Send buffered chunks
+                        yield "".join(pending)
+                        pending.clear()
+                        pending_size = 0
+                        last_flush = now
                 
-                # Send end marker
-                yield f"data: {json.dumps({'type': 'end'})}\n\n"
+                # Send remaining chunks with the end marker
+                pending.append(f"data: {json.dumps({'type': 'end'})}\n\n")
+                yield "".join(pending)
                 
                 # Close connection
                 await stream_manager.close_connection(connection_id)
                 
             except Exception as e:
                 error_data = {"type": "error", "message": str(e)}
-                yield f"data: {json.dumps(error_data)}\n\n"
+                pending.append(f"data: {json.dumps(error_data)}\n\n")
+                yield "".join(pending)
                 
                 # Close connection on error
                 await stream_manager.close_connection(connection_id)
@@ -595,14 +748,7 @@ async def get_metrics(service_factory: ServiceFactory = Depends(get_service_fact
             failed_requests=service_factory.failed_requests,
             success_rate=(service_factory.total_requests - service_factory.failed_requests) / max(service_factory.total_requests, 1),
             uptime=time.time() - service_factory.start_time,
-            services={
-                name: {
-                    "status": info.status.value,
-                    "error_count": info.error_count,
-                    "last_check": info.last_check
-                }
-                for name, info in service_factory.services.items()
-            }
+            services=service_factory.get_services_snapshot()
         )
         
     except Exception as e:
@@ -647,14 +793,16 @@ async def process_document_background_with_progress(
                 if embedding_service:
                     # Extract text from chunks for embedding
                     texts = [chunk.text for chunk in result['chunks']]
-                    embeddings = embedding_service.encode(texts)
+                    embeddings = await _encode_in_pool(texts)
                     
                     # Update chunks with embeddings
-                    for i, chunk in enumerate(result['chunks']):
-                        if i < len(embeddings):
-                            chunk.vector = embeddings[i]
-                        else:
-                            logger.warning(f"Missing embedding for chunk {i}")
+                    chunks = result['chunks']
+                    for chunk, vector in zip(chunks, embeddings):
+                        chunk.vector = vector
+                    if len(embeddings) < len(chunks):
+                        logger.warning(
+                            f"Missing embeddings for chunks {len(embeddings)}-{len(chunks) - 1}"
+                        )
                     
                     logger.info(f"Successfully embedded {len(embeddings)} chunks for {filename}")
                 else:
@@ -716,14 +864,16 @@ async def process_document_background(
                 if embedding_service:
                     # Extract text from chunks for embedding
                     texts = [chunk.text for chunk in result['chunks']]
-                    embeddings = embedding_service.encode(texts)
+                    embeddings = await _encode_in_pool(texts)
                     
                     # Update chunks with embeddings
-                    for i, chunk in enumerate(result['chunks']):
-                        if i < len(embeddings):
-                            chunk.vector = embeddings[i]
-                        else:
-                            logger.warning(f"Missing embedding for chunk {i}")
+                    chunks = result['chunks']
+                    for chunk, vector in zip(chunks, embeddings):
+                        chunk.vector = vector
+                    if len(embeddings) < len(chunks):
+                        logger.warning(
+                            f"Missing embeddings for chunks {len(embeddings)}-{len(chunks) - 1}"
+                        )
                     
                     logger.info(f"Successfully embedded {len(embeddings)} chunks for {filename}")
                 else:
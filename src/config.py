@@ -6,56 +6,72 @@ including environment variable loading, validation, and logging setup.
 """
 
 import os
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
+from typing import List, Optional, Dict, Any, FrozenSet, Mapping, Set, Tuple, Type
+from pydantic import (
+    BaseModel, ConfigDict, Field, TypeAdapter, ValidationError,
+    computed_field, field_serializer, field_validator, model_validator
+)
+from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class DatabaseConfig(BaseSettings):
+# Shared parser for list settings given as JSON arrays
+_STR_LIST_ADAPTER = TypeAdapter(List[str])
+
+# Model configuration shared by every configuration section
+_SECTION_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
+# Background listener draining the root logger's queue, if started, and
+# the process that started it
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_listener_pid: Optional[int] = None
+
+# Directories already created by StorageConfig.ensure_directories
+_ENSURED_DIRECTORIES: Set[str] = set()
+
+
+class DatabaseConfig(BaseModel):
     """Database configuration settings."""
     
+    model_config = _SECTION_CONFIG
+    
     # Qdrant Vector Database
     qdrant_host: str = Field(default="localhost", env="QDRANT_HOST")
     qdrant_port: int = Field(default=6333, env="QDRANT_PORT")
     qdrant_api_key: Optional[str] = Field(default=None, env="QDRANT_API_KEY")
     qdrant_collection_name: str = Field(default="zero_rag_documents", env="QDRANT_COLLECTION_NAME")
-    qdrant_vector_size: int = Field(default=384, env="QDRANT_VECTOR_SIZE")
+    qdrant_vector_size: int = Field(default=384, gt=0, env="QDRANT_VECTOR_SIZE")
     
     # Redis Configuration
     redis_host: str = Field(default="localhost", env="REDIS_HOST")
     redis_port: int = Field(default=6379, env="REDIS_PORT")
     redis_password: Optional[str] = Field(default=None, env="REDIS_PASSWORD")
     redis_db: int = Field(default=0, env="REDIS_DB")
-    redis_cache_ttl: int = Field(default=3600, env="REDIS_CACHE_TTL")
-    
-    @field_validator("qdrant_vector_size")
-    @classmethod
-    def validate_vector_size(cls, v):
-        if v <= 0:
-            raise ValueError("Vector size must be positive")
-        return v
-    
-    @field_validator("redis_cache_ttl")
-    @classmethod
-    def validate_cache_ttl(cls, v):
-        if v < 0:
-            raise ValueError("Cache TTL must be non-negative")
-        return v
+    redis_cache_ttl: int = Field(default=3600, ge=0, env="REDIS_CACHE_TTL")
 
 
-class AIModelConfig(BaseSettings):
+class AIModelConfig(BaseModel):
     """AI model configuration settings."""
     
+    model_config = _SECTION_CONFIG
+    
     # Ollama Configuration
     ollama_host: str = Field(default="http://localhost:11434", env="OLLAMA_HOST")
     ollama_model: str = Field(default="llama3.2:1b", env="OLLAMA_MODEL")
     ollama_timeout: int = Field(default=30, env="OLLAMA_TIMEOUT")
     ollama_max_tokens: int = Field(default=2048, env="OLLAMA_MAX_TOKENS")
-    ollama_temperature: float = Field(default=0.7, env="OLLAMA_TEMPERATURE")
+    ollama_temperature: float = Field(default=0.7, ge=0.0, le=2.0, env="OLLAMA_TEMPERATURE")
     
     # HuggingFace Fallback Configuration
     hf_model_name: str = Field(default="microsoft/DialoGPT-small", env="HF_MODEL_NAME")
@@ -66,29 +82,18 @@ class AIModelConfig(BaseSettings):
     # Embedding Model Configuration
     embedding_model_name: str = Field(default="sentence-transformers/all-MiniLM-L6-v2", env="EMBEDDING_MODEL_NAME")
     embedding_device: str = Field(default="cpu", env="EMBEDDING_DEVICE")
-    embedding_batch_size: int = Field(default=32, env="EMBEDDING_BATCH_SIZE")
+    embedding_batch_size: int = Field(default=32, gt=0, env="EMBEDDING_BATCH_SIZE")
     embedding_max_length: int = Field(default=512, env="EMBEDDING_MAX_LENGTH")
-    
-    @field_validator("ollama_temperature")
-    @classmethod
-    def validate_temperature(cls, v):
-        if not 0.0 <= v <= 2.0:
-            raise ValueError("Temperature must be between 0.0 and 2.0")
-        return v
-    
-    @field_validator("embedding_batch_size")
-    @classmethod
-    def validate_batch_size(cls, v):
-        if v <= 0:
-            raise ValueError("Batch size must be positive")
-        return v
+    embedding_workers: int = Field(default=2, ge=1, env="EMBEDDING_WORKERS")
 
 
-class APIConfig(BaseSettings):
+class APIConfig(BaseModel):
     """API configuration settings."""
     
+    model_config = _SECTION_CONFIG
+    
     host: str = Field(default="127.0.0.1", env="API_HOST")
-    port: int = Field(default=8000, env="API_PORT")
+    port: int = Field(default=8000, ge=1, le=65535, env="API_PORT")
     workers: int = Field(default=1, env="API_WORKERS")
     reload: bool = Field(default=True, env="API_RELOAD")
     log_level: str = Field(default="info", env="API_LOG_LEVEL")
@@ -105,48 +110,53 @@ class APIConfig(BaseSettings):
     gc_interval_seconds: int = Field(default=180, env="GC_INTERVAL_SECONDS")
     batch_size: int = Field(default=100, env="BATCH_SIZE")
     
-    @field_validator("port")
-    @classmethod
-    def validate_port(cls, v):
-        if not 1 <= v <= 65535:
-            raise ValueError("Port must be between 1 and 65535")
-        return v
-    
     @field_validator("cors_origins", mode="before")
     @classmethod
     def parse_cors_origins(cls, v):
         if isinstance(v, str):
             try:
-                return json.loads(v)
-            except json.JSONDecodeError:
+                return _STR_LIST_ADAPTER.validate_json(v)
+            except ValidationError:
                 return [v]
         return v
 
 
-class DocumentConfig(BaseSettings):
+class DocumentConfig(BaseModel):
     """Document processing configuration settings."""
     
+    model_config = _SECTION_CONFIG
+    
     max_file_size: str = Field(default="50MB", env="MAX_FILE_SIZE")
-    supported_formats: str = Field(default="txt,csv,md", env="SUPPORTED_FORMATS")
+    supported_formats: FrozenSet[str] = Field(default="txt,csv,md", validate_default=True, env="SUPPORTED_FORMATS")
     chunk_size: int = Field(default=1000, env="CHUNK_SIZE")
     chunk_overlap: int = Field(default=200, env="CHUNK_OVERLAP")
     max_chunks_per_document: int = Field(default=1000, env="MAX_CHUNKS_PER_DOCUMENT")
+    chunk_cache_size: int = Field(default=128, ge=0, env="CHUNK_CACHE_SIZE")
     
-    @field_validator("supported_formats")
+    @field_validator("supported_formats", mode="before")
     @classmethod
     def parse_supported_formats(cls, v):
         if isinstance(v, str):
             # Handle both JSON array format and comma-separated string
+            formats = None
             if v.startswith('[') and v.endswith(']'):
                 try:
-                    import json
-                    return json.loads(v)
-                except json.JSONDecodeError:
+                    formats = _STR_LIST_ADAPTER.validate_json(v)
+                except ValidationError:
                     pass
-            # Handle comma-separated string
-            return [fmt.strip() for fmt in v.split(",")]
+            if formats is None:
+                formats = v.split(",")
+            v = formats
+        if isinstance(v, (list, tuple, set, frozenset)):
+            # Normalize into a frozenset for constant-time membership checks
+            return frozenset(str(fmt).strip().lower() for fmt in v)
         return v
     
+    @field_serializer("supported_formats")
+    def serialize_supported_formats(self, v):
+        # Keep to_dict() output JSON-serializable and stable
+        return sorted(v)
+    
     @field_validator("max_file_size")
     @classmethod
     def validate_file_size(cls, v):
@@ -157,56 +167,50 @@ class DocumentConfig(BaseSettings):
                 raise ValueError("File size must be positive")
         return v
     
-    @field_validator("chunk_overlap")
-    @classmethod
-    def validate_chunk_overlap(cls, v, info):
-        if "chunk_size" in info.data and v >= info.data["chunk_size"]:
+    @computed_field
+    @cached_property
+    def max_file_size_bytes(self) -> int:
+        """Maximum file size in bytes, parsed once from max_file_size."""
+        size = self.max_file_size.upper().strip()
+        for unit, multiplier in (("GB", 1024 ** 3), ("MB", 1024 ** 2), ("KB", 1024), ("B", 1)):
+            if size.endswith(unit):
+                return int(float(size[:-len(unit)]) * multiplier)
+        return int(size)
+    
+    @model_validator(mode="after")
+    def validate_chunk_overlap(self):
+        if self.chunk_overlap >= self.chunk_size:
             raise ValueError("Chunk overlap must be less than chunk size")
-        return v
+        return self
 
 
-class RAGConfig(BaseSettings):
+class RAGConfig(BaseModel):
     """RAG pipeline configuration settings."""
     
-    top_k_results: int = Field(default=5, env="TOP_K_RESULTS")
-    similarity_threshold: float = Field(default=0.7, env="SIMILARITY_THRESHOLD")
+    model_config = _SECTION_CONFIG
+    
+    top_k_results: int = Field(default=5, gt=0, env="TOP_K_RESULTS")
+    similarity_threshold: float = Field(default=0.7, ge=0.0, le=1.0, env="SIMILARITY_THRESHOLD")
     max_context_length: int = Field(default=4000, env="MAX_CONTEXT_LENGTH")
     enable_streaming: bool = Field(default=True, env="ENABLE_STREAMING")
-    
-    @field_validator("similarity_threshold")
-    @classmethod
-    def validate_similarity_threshold(cls, v):
-        if not 0.0 <= v <= 1.0:
-            raise ValueError("Similarity threshold must be between 0.0 and 1.0")
-        return v
-    
-    @field_validator("top_k_results")
-    @classmethod
-    def validate_top_k(cls, v):
-        if v <= 0:
-            raise ValueError("Top K results must be positive")
-        return v
 
 
-class PerformanceConfig(BaseSettings):
+class PerformanceConfig(BaseModel):
     """Performance and caching configuration settings."""
     
+    model_config = _SECTION_CONFIG
+    
     enable_caching: bool = Field(default=True, env="ENABLE_CACHING")
-    cache_ttl: int = Field(default=3600, env="CACHE_TTL")
+    cache_ttl: int = Field(default=3600, ge=0, env="CACHE_TTL")
     batch_size: int = Field(default=10, env="BATCH_SIZE")
     max_concurrent_requests: int = Field(default=5, env="MAX_CONCURRENT_REQUESTS")
-    
-    @field_validator("cache_ttl")
-    @classmethod
-    def validate_cache_ttl(cls, v):
-        if v < 0:
-            raise ValueError("Cache TTL must be non-negative")
-        return v
 
 
-class LoggingConfig(BaseSettings):
+class LoggingConfig(BaseModel):
     """Logging configuration settings."""
     
+    model_config = _SECTION_CONFIG
+    
     level: str = Field(default="INFO", env="LOG_LEVEL")
     format: str = Field(default="json", env="LOG_FORMAT")
     log_file: str = Field(default="logs/zero_rag.log", env="LOG_FILE")
@@ -221,24 +225,21 @@ class LoggingConfig(BaseSettings):
         return v.upper()
 
 
-class MonitoringConfig(BaseSettings):
+class MonitoringConfig(BaseModel):
     """Monitoring and metrics configuration settings."""
     
+    model_config = _SECTION_CONFIG
+    
     enable_metrics: bool = Field(default=True, env="ENABLE_METRICS")
-    metrics_port: int = Field(default=9090, env="METRICS_PORT")
+    metrics_port: int = Field(default=9090, ge=1, le=65535, env="METRICS_PORT")
     health_check_interval: int = Field(default=30, env="HEALTH_CHECK_INTERVAL")
-    
-    @field_validator("metrics_port")
-    @classmethod
-    def validate_metrics_port(cls, v):
-        if not 1 <= v <= 65535:
-            raise ValueError("Metrics port must be between 1 and 65535")
-        return v
 
 
-class DevelopmentConfig(BaseSettings):
+class DevelopmentConfig(BaseModel):
     """Development and environment configuration settings."""
     
+    model_config = _SECTION_CONFIG
+    
     debug: bool = Field(default=True, env="DEBUG")
     environment: str = Field(default="development", env="ENVIRONMENT")
     enable_hot_reload: bool = Field(default=True, env="ENABLE_HOT_RELOAD")
@@ -253,9 +254,11 @@ class DevelopmentConfig(BaseSettings):
         return v
 
 
-class StorageConfig(BaseSettings):
+class StorageConfig(BaseModel):
     """Data storage configuration settings."""
     
+    model_config = _SECTION_CONFIG
+    
     data_dir: str = Field(default="./data", env="DATA_DIR")
     upload_dir: str = Field(default="./data/uploads", env="UPLOAD_DIR")
     processed_dir: str = Field(default="./data/processed", env="PROCESSED_DIR")
@@ -276,86 +279,286 @@ class StorageConfig(BaseSettings):
             if log_dir:
                 directories.append(log_dir)
         
-        for directory in directories:
+        # Skip directories already created by this process
+        for directory in dict.fromkeys(directories):
+            if directory in _ENSURED_DIRECTORIES:
+                continue
             Path(directory).mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRECTORIES.add(directory)
+
+
+class JsonFormatter(logging.Formatter):
+    """Log formatter that emits each record as a JSON object."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "module": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        
+        if orjson is not None:
+            return orjson.dumps(entry).decode()
+        return json.dumps(entry)
+
+
+class _SectionEnvSettingsSource(PydanticBaseSettingsSource):
+    """
+    Settings source that maps flat environment variables onto config sections.
+    
+    Each section field is read from the variable named after the field
+    (e.g. QDRANT_HOST -> database.qdrant_host), so existing environment and
+    .env files keep working with the nested Settings model.
+    """
+    
+    def __init__(self, settings_cls: Type[BaseSettings], env_vars: Mapping[str, Optional[str]]):
+        super().__init__(settings_cls)
+        self.env_vars = env_vars
+    
+    def get_field_value(self, field: FieldInfo, field_name: str) -> Tuple[Any, str, bool]:
+        # Values are collected per section in __call__
+        return None, field_name, False
+    
+    def __call__(self) -> Dict[str, Any]:
+        sections = {}
+        for section_name, section_field in self.settings_cls.model_fields.items():
+            values = {
+                name: self.env_vars[name]
+                for name in section_field.annotation.model_fields
+                if self.env_vars.get(name) is not None
+            }
+            if values:
+                sections[section_name] = values
+        return sections
+
+
+class Settings(BaseSettings):
+    """All configuration sections, loaded from the environment in a single pass."""
+    
+    model_config = SettingsConfigDict(env_file_encoding="utf-8")
+    
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    ai_model: AIModelConfig = Field(default_factory=AIModelConfig)
+    api: APIConfig = Field(default_factory=APIConfig)
+    document: DocumentConfig = Field(default_factory=DocumentConfig)
+    rag: RAGConfig = Field(default_factory=RAGConfig)
+    performance: PerformanceConfig = Field(default_factory=PerformanceConfig)
+    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
+    development: DevelopmentConfig = Field(default_factory=DevelopmentConfig)
+    storage: StorageConfig = Field(default_factory=StorageConfig)
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        # Environment variables take priority over the .env file
+        env_vars = {**dotenv_settings.env_vars, **env_settings.env_vars}
+        return init_settings, _SectionEnvSettingsSource(settings_cls, env_vars)
+
+
+# Field types whose to_dict() values can be stored as they are
+_CONSTRUCT_FIELD_TYPES = {str, int, float, bool, Optional[str], List[str]}
+
+# Sections construct_from_env may build without validation; the others have
+# fields, like the supported formats frozenset, that must be coerced
+_CONSTRUCTIBLE_SECTIONS = frozenset(
+    field.annotation for field in Settings.model_fields.values()
+    if all(
+        section_field.annotation in _CONSTRUCT_FIELD_TYPES
+        for section_field in field.annotation.model_fields.values()
+    )
+)
+
+
+def _construct_section(section_cls: Type[BaseModel], values: Dict[str, Any]) -> BaseModel:
+    """Build a configuration section from trusted values, ignoring computed fields."""
+    values = {name: value for name, value in values.items() if name in section_cls.model_fields}
+    if section_cls in _CONSTRUCTIBLE_SECTIONS:
+        return section_cls.model_construct(**values)
+    return section_cls.model_validate(values)
 
 
 class Config:
     """Main configuration class that combines all configuration sections."""
     
     def __init__(self, env_file: Optional[str] = None):
-        """Initialize configuration with optional environment file."""
-        # Initialize all configuration sections with environment file
-        self.database = DatabaseConfig(_env_file=env_file)
-        self.ai_model = AIModelConfig(_env_file=env_file)
-        self.api = APIConfig(_env_file=env_file)
-        self.document = DocumentConfig(_env_file=env_file)
-        self.rag = RAGConfig(_env_file=env_file)
-        self.performance = PerformanceConfig(_env_file=env_file)
-        self.logging = LoggingConfig(_env_file=env_file)
-        self.monitoring = MonitoringConfig(_env_file=env_file)
-        self.development = DevelopmentConfig(_env_file=env_file)
-        self.storage = StorageConfig(_env_file=env_file)
+        """
+        Initialize configuration with optional environment file.
+        
+        Settings are read from the environment on first access to a section,
+        and nothing touches disk until bootstrap() is called.
+        """
+        self._env_file = env_file
+    
+    @classmethod
+    def construct_from_env(cls, values: Dict[str, Dict[str, Any]]) -> "Config":
+        """
+        Build a configuration from trusted section values, such as the output of
+        to_dict() captured by a config file watcher during development.
         
+        In the development environment sections of plain values are built
+        with model_construct and skip validation, while sections with fields
+        to coerce are still validated; any other environment validates every
+        value.
+        """
+        config = cls()
+        environment = values.get("development", {}).get("environment", "development")
+        if environment == "development":
+            config._settings = Settings.model_construct(**{
+                name: _construct_section(field.annotation, values.get(name, {}))
+                for name, field in Settings.model_fields.items()
+            })
+        else:
+            config._settings = Settings.model_validate(values)
+        return config
+    
+    @cached_property
+    def _settings(self) -> Settings:
+        """Load all configuration sections with environment file."""
+        return Settings(_env_file=self._env_file)
+    
+    def bootstrap(self) -> "Config":
+        """Create required directories and configure logging."""
         # Ensure directories exist
         self.storage.ensure_directories(self.logging.log_file)
         
         # Setup logging
         self._setup_logging()
+        return self
     
-    def _setup_logging(self):
-        """Configure logging based on settings."""
-        # Create logs directory if it doesn't exist
-        log_dir = os.path.dirname(self.logging.log_file)
-        if log_dir:
-            Path(log_dir).mkdir(parents=True, exist_ok=True)
+    def setup_worker_logging(self):
+        """
+        Configure logging in a pool worker process.
+        
+        Workers write records directly instead of starting a listener
+        thread of their own. A listener started in the worker, e.g. by
+        bootstrap() when a spawned worker first calls get_config(), is
+        stopped; one inherited from a forked parent is only dropped.
+        """
+        self._setup_logging(force=True, use_queue=False)
+    
+    @property
+    def database(self) -> DatabaseConfig:
+        return self._settings.database
+    
+    @property
+    def ai_model(self) -> AIModelConfig:
+        return self._settings.ai_model
+    
+    @property
+    def api(self) -> APIConfig:
+        return self._settings.api
+    
+    @property
+    def document(self) -> DocumentConfig:
+        return self._settings.document
+    
+    @property
+    def rag(self) -> RAGConfig:
+        return self._settings.rag
+    
+    @property
+    def performance(self) -> PerformanceConfig:
+        return self._settings.performance
+    
+    @property
+    def logging(self) -> LoggingConfig:
+        return self._settings.logging
+    
+    @property
+    def monitoring(self) -> MonitoringConfig:
+        return self._settings.monitoring
+    
+    @property
+    def development(self) -> DevelopmentConfig:
+        return self._settings.development
+    
+    @property
+    def storage(self) -> StorageConfig:
+        return self._settings.storage
+    
+    def _setup_logging(self, force: bool = False, use_queue: bool = True):
+        """
+        Configure logging based on settings.
+        
+        Logging is only configured once per process; pass force=True to
+        replace the existing handlers, e.g. after a config reload. With
+        use_queue=False the handlers are attached to the root logger instead
+        of a background queue listener.
+        """
+        root_logger = logging.getLogger()
+        if getattr(root_logger, "_zerorag_configured", False) and not force:
+            return
+        
+        # The log directory is created by storage.ensure_directories in bootstrap()
         
         # Configure logging format
         if self.logging.format.lower() == "json":
-            formatter = logging.Formatter(
-                '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "module": "%(name)s", "message": "%(message)s"}'
-            )
+            formatter = JsonFormatter()
         else:
             formatter = logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             )
         
         # Configure root logger
-        root_logger = logging.getLogger()
         root_logger.setLevel(self.logging.level)
         
-        # Clear existing handlers
+        global _log_listener, _log_listener_pid
+        # Stop the previous listener so its queued records are flushed
+        _stop_log_listener()
+        
+        # Clear existing handlers, releasing open log files
+        for handler in root_logger.handlers:
+            if isinstance(handler, logging.FileHandler):
+                handler.close()
         root_logger.handlers.clear()
         
         # Add console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         # Add file handler if log file is specified
         if self.logging.log_file:
-            file_handler = logging.FileHandler(self.logging.log_file)
+            # Delay opening the file until the first record is written
+            file_handler = logging.FileHandler(self.logging.log_file, delay=True)
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        if use_queue:
+            # Write records from a background thread so callers never block on I/O
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            listener.start()
+            root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            
+            _log_listener = listener
+            _log_listener_pid = os.getpid()
+        else:
+            for handler in handlers:
+                root_logger.addHandler(handler)
         
         # Set debug level if enabled
         if self.logging.enable_debug:
             root_logger.setLevel(logging.DEBUG)
+        
+        root_logger._zerorag_configured = True
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary for serialization."""
-        return {
-            "database": self.database.model_dump(),
-            "ai_model": self.ai_model.model_dump(),
-            "api": self.api.model_dump(),
-            "document": self.document.model_dump(),
-            "rag": self.rag.model_dump(),
-            "performance": self.performance.model_dump(),
-            "logging": self.logging.model_dump(),
-            "monitoring": self.monitoring.model_dump(),
-            "development": self.development.model_dump(),
-            "storage": self.storage.model_dump(),
-        }
+        # One dump of the aggregate settings yields a dict keyed by section
+        return self._settings.model_dump()
     
     def validate(self) -> bool:
         """Validate all configuration settings."""
@@ -367,28 +570,53 @@ class Config:
             logging.error(f"Configuration validation failed: {e}")
             return False
     
-    def get_connection_strings(self) -> Dict[str, str]:
-        """Get database connection strings."""
+    @cached_property
+    def connection_strings(self) -> Dict[str, str]:
+        """Database connection strings, built once per configuration."""
         return {
             "qdrant": f"http://{self.database.qdrant_host}:{self.database.qdrant_port}",
             "redis": f"redis://{self.database.redis_host}:{self.database.redis_port}/{self.database.redis_db}",
         }
+    
+    def get_connection_strings(self) -> Dict[str, str]:
+        """Get database connection strings."""
+        return self.connection_strings
+
 
+def _stop_log_listener():
+    """Stop the active log listener, flushing any queued records."""
+    global _log_listener
+    if _log_listener is not None:
+        # A forked child holds a copy of its parent's listener whose thread
+        # does not run in the child, so the copy is only dropped
+        if _log_listener_pid == os.getpid():
+            _log_listener.stop()
+            for handler in _log_listener.handlers:
+                handler.close()
+        _log_listener = None
 
-# Global configuration instance
-config: Optional[Config] = None
+
+atexit.register(_stop_log_listener)
+
+
+@lru_cache(maxsize=4)
+def _load_config(env_file: Optional[str]) -> Config:
+    """Create, bootstrap and memoize the configuration for an environment file."""
+    return Config(env_file).bootstrap()
 
 
 def get_config(env_file: Optional[str] = None) -> Config:
-    """Get or create the global configuration instance."""
-    global config
-    if config is None:
-        config = Config(env_file)
-    return config
+    """Get or create the configuration instance for an environment file."""
+    # Always pass env_file positionally so get_config() and get_config(None)
+    # share a cache entry
+    return _load_config(env_file)
 
 
 def reload_config(env_file: Optional[str] = None) -> Config:
     """Reload the configuration from environment file."""
-    global config
-    config = Config(env_file)
+    _load_config.cache_clear()
+    config = _load_config(env_file)
+    
+    # Apply the reloaded logging settings over the existing configuration
+    config._setup_logging(force=True)
     return config
@@ -7,19 +7,122 @@ with intelligent chunking, text normalization, and metadata extraction.
 
 import logging
 import hashlib
+import mmap
+import multiprocessing
+import os
 import time
-from typing import Dict, Any, List, Optional, Union, Tuple
+import uuid
+from typing import Dict, Any, Iterator, List, Optional, Union, Tuple
 from pathlib import Path
 import re
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime
 import csv
 import io
+import itertools
+import numpy as np
+
+try:
+    from ..config import Config, get_config
+except ImportError:
+    from config import Config, get_config
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Text files larger than this are decoded from a memory map
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Bytes inspected when detecting the encoding of a non-UTF-8 file
+_ENCODING_PROBE_SIZE = 64 * 1024
+
+# Deletion table for the control characters removed from normalized text
+_CONTROL_CHARS_DELETE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
+# Content features reported by _analyze_content and the patterns revealing them
+_CONTENT_FEATURES = {
+    'has_tables': r'\|',
+    'has_images': r'!\[|[Ii][Mm][Aa][Gg][Ee]:',
+    'has_links': r'http|www\.',
+}
+
+
+class _Patterns:
+    """Regular expressions compiled once for markdown and CSV processing."""
+    
+    # Inline and single-line markdown constructs, matched in one scan. Each
+    # alternative is an outer named group so match.lastgroup names it. Runs
+    # of characters up to a closing delimiter are possessive (Python 3.11+),
+    # so unclosed markers fail fast instead of backtracking through the run.
+    MARKDOWN = re.compile(
+        r'(?P<code_block>```\w*+\n(?P<code>(?s:.*?))\n```)'
+        r'|(?P<inline_code>`(?P<inline>[^`]++)`)'
+        r'|(?P<header>^(?P<header_level>#{1,6})\s+(?P<header_text>.+)$)'
+        r'|(?P<blockquote>^>\s+(?P<quote>.+)$)'
+        r'|(?P<hrule>^[-*_]{3,}+$)'
+        r'|(?P<image>!\[(?P<image_alt>[^\]]*+)\]\([^)]++\))'
+        r'|(?P<link>\[(?P<link_text>[^\]]++)\]\((?P<link_url>[^)]++)\))'
+        r'|(?P<bold_star>\*\*(?P<bold_star_text>[^*]++)\*\*)'
+        r'|(?P<bold_under>__(?P<bold_under_text>[^_]++)__)'
+        r'|(?P<ital_star>\*(?P<ital_star_text>[^*]++)\*)'
+        r'|(?P<ital_under>_(?P<ital_under_text>[^_]++)_)',
+        re.MULTILINE
+    )
+    
+    # Multi-line markdown constructs
+    TABLE = re.compile(r'(\|[^\n]*\|[^\n]*\n\|[^\n]*\|[^\n]*\n(\|[^\n]*\|[^\n]*\n)*)', re.MULTILINE)
+    LIST_ITEM = re.compile(r'^(\s*)([-*+]|\d+\.)\s+(.+)$')
+    
+    # Sentence boundaries: whitespace after terminal punctuation, before a capital
+    SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+    
+    # Whitespace cleanup
+    WS_MULTI = re.compile(r'[ \t]+')
+    BLANK_LINES = re.compile(r'\n\s*\n')
+    
+    # Text normalization
+    WHITESPACE = re.compile(r'\s+')
+    CONTROL_CHARS = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+    
+    # One alternation per subset of content features, so a scan can stop
+    # looking for features once they have been found
+    FEATURES = {
+        frozenset(names): re.compile('|'.join(f'(?P<{name}>{_CONTENT_FEATURES[name]})' for name in names))
+        for size in range(1, len(_CONTENT_FEATURES) + 1)
+        for names in itertools.combinations(_CONTENT_FEATURES, size)
+    }
+    
+    # CSV value types: integers and floats as accepted by int()/float(),
+    # including underscore separators and nan/inf/infinity, and values
+    # starting with YYYY-MM-DD, MM/DD/YYYY or MM-DD-YYYY
+    DATA_TYPE = re.compile(
+        r'(?P<integer>[+-]?\d(?:_?\d)*$)'
+        r'|(?P<float>[+-]?(?:(?:\d(?:_?\d)*(?:\.(?:\d(?:_?\d)*)?)?|\.\d(?:_?\d)*)'
+        r'(?:[eE][+-]?\d(?:_?\d)*)?|(?i:inf|infinity|nan))$)'
+        r'|(?P<date>\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}|\d{2}-\d{2}-\d{4})'
+    )
+
+
+@dataclass(slots=True)
 class DocumentChunk:
     """Document chunk container."""
     text: str
@@ -31,7 +134,7 @@ class DocumentChunk:
     metadata: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentMetadata:
     """Document metadata container with enhanced information."""
     # File information
@@ -91,12 +194,15 @@ class DocumentProcessor:
     - Comprehensive error handling
     """
     
+    __slots__ = (
+        'config', 'max_chunk_size', 'chunk_overlap', 'min_chunk_size',
+        '_max_file_size', '_max_file_size_bytes', '_max_chunks_per_document',
+        'supported_extensions', '_markdown_handlers', '_chunk_cache',
+        '_chunk_cache_size', '_csv_formatters', '_processing_metrics',
+    )
+    
     def __init__(self, config=None):
         """Initialize the document processor."""
-        try:
-            from ..config import get_config
-        except ImportError:
-            from config import get_config
         self.config = config or get_config()
         
         # Processing settings
@@ -104,6 +210,11 @@ class DocumentProcessor:
         self.chunk_overlap = self.config.document.chunk_overlap
         self.min_chunk_size = self.config.document.chunk_size // 4  # 25% of max chunk size
         
+        # Limits read on every document or health check
+        self._max_file_size = self.config.document.max_file_size
+        self._max_file_size_bytes = self.config.document.max_file_size_bytes
+        self._max_chunks_per_document = self.config.document.max_chunks_per_document
+        
         # Supported file types
         self.supported_extensions = {
             '.txt': self._process_text_file,
@@ -111,6 +222,37 @@ class DocumentProcessor:
             '.md': self._process_markdown_file,
         }
         
+        # Renderers for constructs matched by _Patterns.MARKDOWN
+        inline = self._convert_markdown_inline
+        self._markdown_handlers = {
+            'code_block': lambda m: f"[Code Block: {m['code']}]",
+            'inline_code': lambda m: m['inline'],
+            'header': lambda m: self._convert_header(len(m['header_level']), inline(m['header_text'])),
+            'blockquote': lambda m: f"Quote: {inline(m['quote'])}",
+            'hrule': lambda m: '---',
+            'image': lambda m: f"[Image: {m['image_alt']}]",
+            'link': lambda m: f"{inline(m['link_text'])} (URL: {m['link_url']})",
+            'bold_star': lambda m: inline(m['bold_star_text']),
+            'bold_under': lambda m: inline(m['bold_under_text']),
+            'ital_star': lambda m: inline(m['ital_star_text']),
+            'ital_under': lambda m: inline(m['ital_under_text']),
+        }
+        
+        # Chunks and content analysis of recently processed documents, keyed by
+        # content hash and file name
+        self._chunk_cache: OrderedDict[Tuple[str, str], Tuple[List[DocumentChunk], Dict[str, Any]]] = OrderedDict()
+        self._chunk_cache_size = (
+            self.config.document.chunk_cache_size if self.config.performance.enable_caching else 0
+        )
+        
+        # CSV value formatters by detected data type
+        self._csv_formatters = {
+            'integer': self._format_csv_integer,
+            'float': self._format_csv_float,
+            'date': self._format_csv_string,
+            'string': self._format_csv_string,
+        }
+        
         # Performance tracking
         self._processing_metrics = {
             'total_documents': 0,
@@ -156,54 +298,44 @@ class DocumentProcessor:
             RuntimeError: If processing fails
         """
         file_path = Path(file_path)
-        
-        if not file_path.exists():
-            raise ValueError(f"File does not exist: {file_path}")
-        
-        if not file_path.is_file():
-            raise ValueError(f"Path is not a file: {file_path}")
-        
-        # Check file extension
-        file_extension = file_path.suffix.lower()
-        if file_extension not in self.supported_extensions:
-            raise ValueError(f"Unsupported file type: {file_extension}")
+        file_extension = self._check_document_path(file_path)
         
         start_time = time.time()
+        # Every chunk of this run is stamped with the same creation time
+        run_timestamp = datetime.fromtimestamp(start_time).isoformat()
         
         try:
             logger.info(f"Processing document: {file_path}")
             
-            # Get file metadata
-            metadata = self._extract_file_metadata(file_path)
-            
-            # Validate document
-            if not self._validate_document(file_path, metadata):
-                error_msg = f"Document validation failed: {', '.join(metadata.validation_errors)}"
-                logger.error(error_msg)
-                metadata.processing_status = 'failed'
-                metadata.error_message = error_msg
-                metadata.processing_time = time.time() - start_time
-                raise ValueError(error_msg)
+            # Get and validate file metadata
+            metadata = self._extract_and_validate_metadata(file_path, start_time)
             
             # Update processing status
             metadata.processing_status = 'processing'
             
-            # Process file based on type
-            processor_func = self.supported_extensions[file_extension]
-            raw_text = processor_func(file_path)
-            
-            # Clean and normalize text
-            cleaned_text = self._clean_and_normalize_text(raw_text)
-            
-            # Analyze content for enhanced metadata
-            content_analysis = self._analyze_content(cleaned_text, metadata.file_type)
-            
-            # Generate chunks
-            chunks = self._generate_chunks(cleaned_text, file_path.name)
+            # Reuse the chunks of an identical document processed recently
+            cache_key = (metadata.content_hash, file_path.name)
+            cached = self._get_cached_chunks(cache_key, run_timestamp)
+            if cached is not None:
+                chunks, content_analysis = cached
+            else:
+                # Process file based on type
+                processor_func = self.supported_extensions[file_extension]
+                raw_text = processor_func(file_path)
+                
+                # Clean and normalize text
+                cleaned_text = self._clean_and_normalize_text(raw_text)
+                
+                # Analyze content for enhanced metadata
+                content_analysis = self._analyze_content(cleaned_text, metadata.file_type)
+                
+                # Generate chunks
+                chunks = self._generate_chunks(cleaned_text, file_path.name, run_timestamp)
+                self._cache_chunks(cache_key, chunks, content_analysis)
             
             # Update metadata with comprehensive information
-            metadata.word_count = len(cleaned_text.split())
-            metadata.char_count = len(cleaned_text)
+            metadata.word_count = content_analysis['word_count']
+            metadata.char_count = content_analysis['char_count']
             metadata.chunk_count = len(chunks)
             metadata.sentence_count = content_analysis['sentence_count']
             metadata.paragraph_count = content_analysis['paragraph_count']
@@ -238,6 +370,122 @@ class DocumentProcessor:
             
             raise RuntimeError(error_msg)
     
+    def process_document_streaming(self, file_path: Union[str, Path]) -> Iterator[DocumentChunk]:
+        """
+        Process a document and yield its chunks as they are created.
+        
+        Unlike process_document, the chunks are neither collected nor cached,
+        so callers can hand each one on (e.g. to an embedding batch) without
+        holding the whole document's chunks in memory.
+        
+        Args:
+            file_path: Path to the document file
+            
+        Yields:
+            DocumentChunk for each chunk of the document, in order
+            
+        Raises:
+            ValueError: If file doesn't exist or is unsupported
+            RuntimeError: If processing fails
+        """
+        file_path = Path(file_path)
+        file_extension = self._check_document_path(file_path)
+        
+        start_time = time.time()
+        run_timestamp = datetime.fromtimestamp(start_time).isoformat()
+        chunk_count = 0
+        
+        try:
+            logger.info(f"Streaming document: {file_path}")
+            
+            self._extract_and_validate_metadata(file_path, start_time)
+            
+            raw_text = self.supported_extensions[file_extension](file_path)
+            cleaned_text = self._clean_and_normalize_text(raw_text)
+            del raw_text
+            
+            for chunk in self._iter_chunks(cleaned_text, file_path.name, run_timestamp):
+                chunk_count += 1
+                yield chunk
+            
+            processing_time = time.time() - start_time
+            self._update_metrics(chunk_count, processing_time)
+            
+            logger.info(f"Successfully streamed {file_path.name}: {chunk_count} chunks in {processing_time:.2f}s")
+            
+        except Exception as e:
+            error_msg = f"Failed to process document {file_path}: {e}"
+            logger.error(error_msg)
+            self._processing_metrics['errors'].append(error_msg)
+            raise RuntimeError(error_msg)
+    
+    def _check_document_path(self, file_path: Path) -> str:
+        """Check that the path is an existing file of a supported type and return its extension."""
+        if not file_path.exists():
+            raise ValueError(f"File does not exist: {file_path}")
+        
+        if not file_path.is_file():
+            raise ValueError(f"Path is not a file: {file_path}")
+        
+        # Check file extension
+        file_extension = file_path.suffix.lower()
+        if file_extension not in self.supported_extensions:
+            raise ValueError(f"Unsupported file type: {file_extension}")
+        
+        return file_extension
+    
+    def _extract_and_validate_metadata(self, file_path: Path, start_time: float) -> DocumentMetadata:
+        """Extract file metadata and raise ValueError if the document fails validation."""
+        metadata = self._extract_file_metadata(file_path)
+        
+        if not self._validate_document(file_path, metadata):
+            error_msg = f"Document validation failed: {', '.join(metadata.validation_errors)}"
+            logger.error(error_msg)
+            metadata.processing_status = 'failed'
+            metadata.error_message = error_msg
+            metadata.processing_time = time.time() - start_time
+            raise ValueError(error_msg)
+        
+        return metadata
+    
+    def process_documents(self, file_paths: List[Union[str, Path]],
+                          max_workers: Optional[int] = None,
+                          chunksize: int = 8) -> Iterator[Tuple[List[DocumentChunk], DocumentMetadata]]:
+        """
+        Process several documents in parallel worker processes.
+        
+        Args:
+            file_paths: Paths to the document files
+            max_workers: Number of worker processes (defaults to the CPU count)
+            chunksize: Number of documents sent to a worker per task
+            
+        Yields:
+            Tuple[List[DocumentChunk], DocumentMetadata] for each document, in
+            input order; documents that fail are logged and skipped
+        """
+        # Workers are spawned rather than forked: this process runs the log
+        # listener and health check threads, and a forked child can inherit
+        # their locks held
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_document_worker,
+            initargs=(self.config.to_dict(),)
+        ) as executor:
+            results = executor.map(
+                _process_document_in_worker, [str(path) for path in file_paths], chunksize=chunksize
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(str(result))
+                    self._processing_metrics['errors'].append(str(result))
+                    continue
+                
+                chunks, metadata = result
+                # Worker metrics stay in the worker process, so merge them here
+                self._update_metrics(len(chunks), metadata.processing_time)
+                yield chunks, metadata
+    
     def process_file(self, file_path: Union[str, Path], document_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Process a file and return a result object compatible with the API.
@@ -261,26 +509,27 @@ class DocumentProcessor:
                 from .vector_store import VectorDocument
             except ImportError:
                 from vector_store import VectorDocument
-            vector_documents = []
             
-            for chunk in chunks:
-                # Add document_id to chunk metadata if provided
-                if document_id:
-                    chunk.metadata['document_id'] = document_id
-                
-                # Generate a proper UUID for Qdrant
-                import uuid
-                vector_doc = VectorDocument(
-                    id=str(uuid.uuid4()),
+            # Draw the randomness for every chunk's UUID in one call, and
+            # stamp all chunks with the same creation time
+            random_bytes = os.urandom(16 * len(chunks))
+            now = datetime.now()
+            
+            vector_documents = [
+                VectorDocument(
+                    # Generate a proper UUID (version 4) for Qdrant
+                    id=str(uuid.UUID(bytes=random_bytes[i * 16:(i + 1) * 16], version=4)),
                     text=chunk.text,
                     vector=[],  # Will be populated by embedding service
-                    metadata=chunk.metadata,
+                    # Add document_id to a copy of the chunk metadata if provided
+                    metadata={**chunk.metadata, 'document_id': document_id} if document_id else chunk.metadata,
                     source_file=chunk.source_file,
                     chunk_index=chunk.chunk_index,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now()
+                    created_at=now,
+                    updated_at=now
                 )
-                vector_documents.append(vector_doc)
+                for i, chunk in enumerate(chunks)
+            ]
             
             return {
                 'chunks': vector_documents,
@@ -291,6 +540,35 @@ class DocumentProcessor:
             logger.error(f"process_file failed for {file_path}: {e}")
             raise
     
+    def _get_cached_chunks(self, key: Tuple[str, str],
+                           created_at: str) -> Optional[Tuple[List[DocumentChunk], Dict[str, Any]]]:
+        """Get copies of cached chunks stamped with this run's creation time, if present."""
+        cached = self._chunk_cache.get(key)
+        if cached is None:
+            return None
+        
+        self._chunk_cache.move_to_end(key)
+        chunks, content_analysis = cached
+        # Callers may annotate chunk metadata, so never hand out cached objects
+        return [
+            replace(chunk, metadata={**chunk.metadata, 'created_at': created_at})
+            for chunk in chunks
+        ], content_analysis
+    
+    def _cache_chunks(self, key: Tuple[str, str], chunks: List[DocumentChunk],
+                      content_analysis: Dict[str, Any]):
+        """Cache copies of a document's chunks, evicting the least recently used."""
+        if self._chunk_cache_size <= 0:
+            return
+        
+        self._chunk_cache[key] = (
+            [replace(chunk, metadata=dict(chunk.metadata)) for chunk in chunks],
+            content_analysis
+        )
+        self._chunk_cache.move_to_end(key)
+        while len(self._chunk_cache) > self._chunk_cache_size:
+            self._chunk_cache.popitem(last=False)
+    
     def _extract_file_metadata(self, file_path: Path) -> DocumentMetadata:
         """Extract file metadata."""
         stat = file_path.stat()
@@ -327,19 +605,26 @@ class DocumentProcessor:
         )
     
     def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate MD5 hash of file content."""
-        hash_md5 = hashlib.md5()
+        """Calculate hash of file content (BLAKE3 if installed, else BLAKE2b-128)."""
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            if blake3 is None:
+                # file_digest runs the read loop in C; a 16-byte digest keeps
+                # the same width as BLAKE3 below (and the former MD5)
+                return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+            
+            # Empty files cannot be memory-mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return blake3.blake3().hexdigest(length=16)
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return blake3.blake3(mm, max_threads=blake3.blake3.AUTO).hexdigest(length=16)
     
     def _validate_document(self, file_path: Path, metadata: DocumentMetadata) -> bool:
         """Validate document before processing."""
         validation_errors = []
         
         # Check file size
-        max_size_bytes = self._parse_file_size(self.config.document.max_file_size)
+        max_size_bytes = self._max_file_size_bytes
         if metadata.file_size > max_size_bytes:
             validation_errors.append(f"File size {metadata.file_size} bytes exceeds limit of {max_size_bytes} bytes")
         
@@ -351,12 +636,10 @@ class DocumentProcessor:
         if metadata.file_size == 0:
             validation_errors.append("File is empty")
         
-        # Check if file is readable
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                f.read(1)  # Try to read first character
-        except Exception as e:
-            validation_errors.append(f"File is not readable: {e}")
+        # Check if file is readable; decoding is left to the format readers,
+        # which fall back to other encodings when UTF-8 fails
+        if not os.access(file_path, os.R_OK):
+            validation_errors.append("File is not readable")
         
         # Update metadata with validation results
         metadata.is_valid = len(validation_errors) == 0
@@ -364,21 +647,11 @@ class DocumentProcessor:
         
         return metadata.is_valid
     
-    def _parse_file_size(self, size_str: str) -> int:
-        """Parse file size string to bytes."""
-        size_str = size_str.upper().strip()
-        if size_str.endswith('MB'):
-            return int(float(size_str[:-2]) * 1024 * 1024)
-        elif size_str.endswith('KB'):
-            return int(float(size_str[:-2]) * 1024)
-        elif size_str.endswith('GB'):
-            return int(float(size_str[:-2]) * 1024 * 1024 * 1024)
-        else:
-            return int(size_str)
-    
     def _analyze_content(self, text: str, file_type: str) -> Dict[str, Any]:
         """Analyze content for enhanced metadata."""
         analysis = {
+            'word_count': 0,
+            'char_count': 0,
             'sentence_count': 0,
             'paragraph_count': 0,
             'line_count': 0,
@@ -392,21 +665,33 @@ class DocumentProcessor:
         if not text:
             return analysis
         
-        # Count lines
-        analysis['line_count'] = len(text.split('\n'))
+        # Count words, characters and lines
+        analysis['word_count'] = len(text.split())
+        analysis['char_count'] = len(text)
+        analysis['line_count'] = text.count('\n') + 1
         
-        # Count paragraphs (non-empty lines separated by empty lines)
-        paragraphs = [p for p in text.split('\n\n') if p.strip()]
-        analysis['paragraph_count'] = len(paragraphs)
+        # Count paragraphs (non-empty lines separated by empty lines) without
+        # keeping a list of them; text without blank lines is one paragraph
+        if '\n\n' in text:
+            analysis['paragraph_count'] = sum(1 for p in text.split('\n\n') if p.strip())
+        else:
+            analysis['paragraph_count'] = 0 if text.isspace() else 1
         
         # Count sentences
-        sentences = self._split_into_sentences(text)
-        analysis['sentence_count'] = len(sentences)
-        
-        # Detect content features
-        analysis['has_tables'] = '|' in text and '\n' in text
-        analysis['has_images'] = '![' in text or 'image:' in text.lower()
-        analysis['has_links'] = 'http' in text or 'www.' in text
+        analysis['sentence_count'] = self._count_sentences(text)
+        
+        # Detect content features in a single scan, narrowing the pattern to
+        # the features not yet found after each hit
+        remaining = frozenset(_CONTENT_FEATURES)
+        pos = 0
+        while remaining:
+            match = _Patterns.FEATURES[remaining].search(text, pos)
+            if not match:
+                break
+            analysis[match.lastgroup] = True
+            remaining -= {match.lastgroup}
+            pos = match.start()
+        analysis['has_tables'] = analysis['has_tables'] and analysis['line_count'] > 1
         
         # Determine content type
         if file_type == 'csv':
@@ -420,8 +705,15 @@ class DocumentProcessor:
         
         # Basic language detection (English vs non-English)
         # This is a simple heuristic - in production, use a proper language detection library
-        english_chars = sum(1 for c in text if c.isalpha() and ord(c) < 128)
-        total_chars = sum(1 for c in text if c.isalpha())
+        # Counted on the code points: ASCII letters (case folded with | 0x20)
+        # against all letters, calling isalpha once per distinct non-ASCII code point
+        codes = np.frombuffer(text.encode('utf-32-le', 'ignore'), dtype=np.uint32)
+        folded = codes | 0x20
+        english_chars = int(np.count_nonzero((folded >= 0x61) & (folded <= 0x7A)))
+        non_ascii, counts = np.unique(codes[codes >= 0x80], return_counts=True)
+        total_chars = english_chars + sum(
+            count for code, count in zip(non_ascii.tolist(), counts.tolist()) if chr(code).isalpha()
+        )
         if total_chars > 0 and english_chars / total_chars > 0.9:
             analysis['language_detected'] = 'en'
         else:
@@ -431,18 +723,35 @@ class DocumentProcessor:
     
     def _process_text_file(self, file_path: Path) -> str:
         """Process a text file."""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                # Decode large files straight from a memory map so the file
+                # contents are never copied into an intermediate bytes object
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+                    return self._decode_file(file_path, raw)
+            
+            # Read smaller files once and decode them in a single call
+            return self._decode_file(file_path, f.read())
+    
+    def _decode_file(self, file_path: Path, raw) -> str:
+        """Decode file contents, trying UTF-8 first and then fallback encodings."""
         try:
             # Try UTF-8 first
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return content
+            return self._decode_text(raw, 'utf-8')
         except UnicodeDecodeError:
+            # Detect the encoding from the start of the file when possible
+            if charset_normalizer is not None:
+                match = charset_normalizer.from_bytes(raw[:_ENCODING_PROBE_SIZE]).best()
+                if match is not None:
+                    logger.info(f"Detected {match.encoding} encoding for {file_path}")
+                    # The rest of the file may hold bytes the probe did not see
+                    return self._decode_text(raw, match.encoding, errors='replace')
+            
             # Fallback to other encodings
             encodings = ['latin-1', 'cp1252', 'iso-8859-1']
             for encoding in encodings:
                 try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        content = f.read()
+                    content = self._decode_text(raw, encoding)
                     logger.info(f"Successfully read {file_path} with {encoding} encoding")
                     return content
                 except UnicodeDecodeError:
@@ -450,8 +759,24 @@ class DocumentProcessor:
             
             raise RuntimeError(f"Could not decode {file_path} with any supported encoding")
     
+    def _decode_text(self, raw, encoding: str, errors: str = 'strict') -> str:
+        """Decode file bytes, translating line endings as a text-mode read would."""
+        # str() decodes any buffer, including a memory map, without copying it
+        content = str(raw, encoding, errors)
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
     def _process_csv_file(self, file_path: Path) -> str:
         """Process a CSV file and convert to text with enhanced features."""
+        if pa is not None:
+            try:
+                content = self._process_csv_with_arrow(file_path)
+                if content is not None:
+                    return content
+            except pa.ArrowInvalid as e:
+                logger.debug(f"Arrow could not parse {file_path}, falling back to csv module: {e}")
+        
         try:
             with open(file_path, 'r', encoding='utf-8', newline='') as f:
                 reader = csv.reader(f)
@@ -461,53 +786,57 @@ class DocumentProcessor:
                 if not header:
                     return "Empty CSV file"
                 
-                # Analyze data types and structure
-                data_types = self._analyze_csv_data_types(header, reader)
+                # Analyze data types from a sample of rows, which are then
+                # replayed ahead of the rest of the reader
+                sample_rows = list(itertools.islice(reader, 10))
+                data_types = self._analyze_csv_data_types(header, sample_rows)
                 
-                # Reset file pointer for full processing
-                f.seek(0)
-                reader = csv.reader(f)
-                next(reader)  # Skip header again
-                
-                # Convert to text format with enhanced structure
-                lines = []
-                lines.append("CSV Document Analysis")
-                lines.append("=" * 60)
-                lines.append(f"File: {file_path.name}")
-                lines.append(f"Columns: {len(header)}")
-                lines.append(f"Column Headers: {', '.join(header)}")
-                lines.append("")
+                # Convert to text format with enhanced structure, writing
+                # straight into one buffer
+                buf = io.StringIO()
+                write = buf.write
+                write("CSV Document Analysis\n")
+                write("=" * 60 + "\n")
+                write(f"File: {file_path.name}\n")
+                write(f"Columns: {len(header)}\n")
+                write(f"Column Headers: {', '.join(header)}\n")
+                write("\n")
                 
                 # Add data type information
-                lines.append("Data Types:")
+                write("Data Types:\n")
                 for col_name, data_type in data_types.items():
-                    lines.append(f"  - {col_name}: {data_type}")
-                lines.append("")
+                    write(f"  - {col_name}: {data_type}\n")
+                write("\n")
+                
+                # Resolve each column's formatter once instead of per cell
+                column_formatters = [
+                    (col_name, self._csv_formatters.get(data_types.get(col_name, 'string'), self._format_csv_string))
+                    for col_name in header
+                ]
                 
                 # Process rows with better formatting
                 row_count = 0
-                for i, row in enumerate(reader, 1):
+                for i, row in enumerate(itertools.chain(sample_rows, reader), 1):
                     if not row:  # Skip empty rows
                         continue
                     
                     row_count += 1
                     
-                    # Create a structured row representation
-                    row_data = []
-                    for j, (col_name, value) in enumerate(zip(header, row)):
-                        # Format based on data type
-                        formatted_value = self._format_csv_value(value, data_types.get(col_name, 'string'))
-                        row_data.append(f"{col_name}: {formatted_value}")
+                    # Create a structured row representation, formatting each
+                    # value based on its column's data type
+                    row_data = [
+                        f"{col_name}: {format_value(value)}"
+                        for (col_name, format_value), value in zip(column_formatters, row)
+                    ]
                     
-                    row_text = f"Row {i}: {' | '.join(row_data)}"
-                    lines.append(row_text)
+                    write(f"Row {i}: {' | '.join(row_data)}\n")
                 
                 # Add summary
-                lines.append("")
-                lines.append(f"Total Rows: {row_count}")
-                lines.append(f"Total Columns: {len(header)}")
+                write("\n")
+                write(f"Total Rows: {row_count}\n")
+                write(f"Total Columns: {len(header)}")
                 
-                return "\n".join(lines)
+                return buf.getvalue()
                 
         except UnicodeDecodeError:
             # Try alternative encodings
@@ -529,37 +858,145 @@ class DocumentProcessor:
             logger.error(f"Failed to process CSV file {file_path}: {e}")
             raise RuntimeError(f"CSV processing failed: {e}")
     
+    def _process_csv_with_arrow(self, file_path: Path) -> Optional[str]:
+        """
+        Process a CSV file with Arrow's multithreaded parser and type inference.
+        
+        Returns None if the file is not valid UTF-8, so the caller can retry
+        with the csv module and its encoding fallbacks.
+        """
+        # Only empty cells are nulls, as in the csv module path, so text such
+        # as "nan" or "NULL" is kept
+        read_options = pacsv.ReadOptions(block_size=1 << 20)
+        table = pacsv.read_csv(
+            file_path,
+            read_options=read_options,
+            convert_options=pacsv.ConvertOptions(null_values=[""], strings_can_be_null=True)
+        )
+        
+        # Arrow keeps undecodable text columns as binary
+        if any(pa.types.is_binary(field.type) for field in table.schema):
+            return None
+        
+        header = table.column_names
+        data_types = [self._arrow_data_type(field.type) for field in table.schema]
+        
+        # Booleans, dates, times and timestamps would be cast back to text in
+        # Arrow's own format (True becomes true, offsets are converted to UTC),
+        # so those columns are read again as the source text
+        text_columns = {
+            field.name: pa.string() for field in table.schema
+            if not (
+                pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+                or pa.types.is_string(field.type) or pa.types.is_null(field.type)
+            )
+        }
+        if text_columns:
+            table = pacsv.read_csv(
+                file_path,
+                read_options=read_options,
+                convert_options=pacsv.ConvertOptions(
+                    null_values=[""], strings_can_be_null=True, column_types=text_columns
+                )
+            )
+        
+        # Convert to text format with enhanced structure, writing straight
+        # into one buffer
+        buf = io.StringIO()
+        write = buf.write
+        write("CSV Document Analysis\n")
+        write("=" * 60 + "\n")
+        write(f"File: {file_path.name}\n")
+        write(f"Columns: {len(header)}\n")
+        write(f"Column Headers: {', '.join(header)}\n")
+        write("\n")
+        
+        # Add data type information
+        write("Data Types:\n")
+        for col_name, data_type in zip(header, data_types):
+            write(f"  - {col_name}: {data_type}\n")
+        write("\n")
+        
+        # Build the rows' text column-wise and write each record batch with
+        # a single join
+        row_index = 1
+        for batch in table.to_batches():
+            cells = [
+                self._format_arrow_column(col_name, column, data_type)
+                for col_name, column, data_type in zip(header, batch.columns, data_types)
+            ]
+            row_numbers = pc.cast(pa.array(np.arange(row_index, row_index + batch.num_rows)), pa.string())
+            rows = pc.binary_join_element_wise(
+                "Row ", row_numbers, ": ", pc.binary_join_element_wise(*cells, ' | '), "\n", ''
+            )
+            write(pc.binary_join(pa.ListArray.from_arrays(pa.array([0, len(rows)], pa.int32()), rows), '')[0].as_py())
+            row_index += batch.num_rows
+        
+        # Add summary
+        write("\n")
+        write(f"Total Rows: {table.num_rows}\n")
+        write(f"Total Columns: {len(header)}")
+        
+        return buf.getvalue()
+    
+    def _arrow_data_type(self, arrow_type) -> str:
+        """Map an inferred Arrow type to a CSV data type name."""
+        if pa.types.is_integer(arrow_type):
+            return 'integer'
+        if pa.types.is_floating(arrow_type):
+            return 'float'
+        if pa.types.is_date(arrow_type) or pa.types.is_timestamp(arrow_type):
+            return 'date'
+        return 'string'
+    
+    def _format_arrow_column(self, col_name: str, column, data_type: str):
+        """Format an Arrow column as "name: value" strings, like _format_csv_value."""
+        if data_type == 'float':
+            # Casting to a scale-2 decimal rounds to two places like "{:.2f}".
+            # Values beyond the decimal's range raise ArrowInvalid, and the
+            # file is then converted with the csv module instead
+            finite = pc.is_finite(column)
+            decimals = pc.cast(pc.if_else(finite, column, 0.0), pa.decimal128(38, 2))
+            values = pc.cast(decimals, pa.string())
+            # Negative values that round to zero keep their sign, as in "-0.00"
+            negative = pc.less(column.view(pa.int64()), 0)
+            values = pc.if_else(pc.and_(negative, pc.equal(decimals, 0)), '-0.00', values)
+            special = pc.if_else(pc.is_nan(column), 'nan', pc.if_else(negative, '-inf', 'inf'))
+            values = pc.if_else(finite, values, special)
+        else:
+            values = pc.cast(column, pa.string())
+        if data_type == 'string':
+            values = pc.if_else(pc.equal(pc.utf8_trim_whitespace(values), ''), None, values)
+        values = pc.fill_null(values, '(empty)')
+        return pc.binary_join_element_wise(f"{col_name}: ", values, '')
+    
     def _process_csv_with_encoding(self, file_path: Path, encoding: str) -> str:
         """Process CSV file with specific encoding."""
         with open(file_path, 'r', encoding=encoding, newline='') as f:
             reader = csv.reader(f)
             header = next(reader, [])
             
-            lines = []
-            lines.append(f"CSV Document (Encoding: {encoding})")
-            lines.append("=" * 50)
-            lines.append(f"Columns: {', '.join(header)}")
-            lines.append("")
+            buf = io.StringIO()
+            write = buf.write
+            write(f"CSV Document (Encoding: {encoding})\n")
+            write("=" * 50 + "\n")
+            write(f"Columns: {', '.join(header)}\n")
             
+            # csv.reader already yields strings, so cells are joined as-is
             for i, row in enumerate(reader, 1):
                 if not row:
                     continue
-                row_text = f"Row {i}: {', '.join(str(cell) for cell in row)}"
-                lines.append(row_text)
+                write(f"\nRow {i}: ")
+                write(', '.join(row))
             
-            return "\n".join(lines)
+            return buf.getvalue()
     
-    def _analyze_csv_data_types(self, header: List[str], reader) -> Dict[str, str]:
+    def _analyze_csv_data_types(self, header: List[str], sample_rows: List[List[str]]) -> Dict[str, str]:
         """Analyze CSV data types by examining sample rows."""
         data_types = {}
-        sample_rows = []
         
-        # Collect sample rows for analysis
-        for i, row in enumerate(reader):
-            if i >= 10:  # Analyze first 10 rows
-                break
-            if row and len(row) == len(header):
-                sample_rows.append(row)
+        # Only complete rows are considered
+        sample_rows = [row for row in sample_rows if row and len(row) == len(header)]
         
         # Analyze each column
         for col_idx, col_name in enumerate(header):
@@ -573,75 +1010,57 @@ class DocumentProcessor:
         if not values:
             return 'string'
         
-        # Check for numeric types
-        numeric_count = 0
-        float_count = 0
-        date_count = 0
+        # Classify each value with one match instead of int()/float() attempts
+        counts = {'integer': 0, 'float': 0, 'date': 0}
+        total_valid = 0
         
         for value in values:
             value = value.strip()
             if not value:
                 continue
             
-            # Check for integers
-            try:
-                int(value)
-                numeric_count += 1
-                continue
-            except ValueError:
-                pass
-            
-            # Check for floats
-            try:
-                float(value)
-                float_count += 1
-                continue
-            except ValueError:
-                pass
-            
-            # Check for dates (basic patterns)
-            date_patterns = [
-                r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-                r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-                r'\d{2}-\d{2}-\d{4}',  # MM-DD-YYYY
-            ]
-            for pattern in date_patterns:
-                if re.match(pattern, value):
-                    date_count += 1
-                    break
+            total_valid += 1
+            match = _Patterns.DATA_TYPE.match(value)
+            if match:
+                counts[match.lastgroup] += 1
         
-        total_valid = len([v for v in values if v.strip()])
         if total_valid == 0:
             return 'string'
         
         # Determine dominant type
-        if date_count / total_valid > 0.5:
+        if counts['date'] / total_valid > 0.5:
             return 'date'
-        elif float_count / total_valid > 0.5:
+        elif counts['float'] / total_valid > 0.5:
             return 'float'
-        elif numeric_count / total_valid > 0.5:
+        elif counts['integer'] / total_valid > 0.5:
             return 'integer'
         else:
             return 'string'
     
     def _format_csv_value(self, value: str, data_type: str) -> str:
         """Format CSV value based on detected data type."""
+        return self._csv_formatters.get(data_type, self._format_csv_string)(value)
+    
+    def _format_csv_string(self, value: str) -> str:
+        """Format a string or date CSV value, which is kept as is."""
+        return value if value.strip() else "(empty)"
+    
+    def _format_csv_integer(self, value: str) -> str:
+        """Format an integer CSV value."""
         if not value.strip():
             return "(empty)"
-        
-        if data_type == 'integer':
-            try:
-                return str(int(value))
-            except ValueError:
-                return value
-        elif data_type == 'float':
-            try:
-                return f"{float(value):.2f}"
-            except ValueError:
-                return value
-        elif data_type == 'date':
-            return value  # Keep date as is
-        else:
+        try:
+            return str(int(value))
+        except ValueError:
+            return value
+    
+    def _format_csv_float(self, value: str) -> str:
+        """Format a float CSV value with two decimal places."""
+        if not value.strip():
+            return "(empty)"
+        try:
+            return f"{float(value):.2f}"
+        except ValueError:
             return value
     
     def _process_markdown_file(self, file_path: Path) -> str:
@@ -663,28 +1082,8 @@ class DocumentProcessor:
         if not content:
             return ""
         
-        # Remove code blocks (keep content for context)
-        content = re.sub(r'```[\w]*\n(.*?)\n```', r'[Code Block: \1]', content, flags=re.DOTALL)
-        
-        # Remove inline code markers but keep content
-        content = re.sub(r'`([^`]+)`', r'\1', content)
-        
-        # Process headers (convert to plain text with hierarchy indication)
-        content = re.sub(r'^(#{1,6})\s+(.+)$', self._convert_header, content, flags=re.MULTILINE)
-        
-        # Process bold text (keep content)
-        content = re.sub(r'\*\*([^*]+)\*\*', r'\1', content)
-        content = re.sub(r'__([^_]+)__', r'\1', content)
-        
-        # Process italic text (keep content)
-        content = re.sub(r'\*([^*]+)\*', r'\1', content)
-        content = re.sub(r'_([^_]+)_', r'\1', content)
-        
-        # Process links (extract text and URL)
-        content = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'\1 (URL: \2)', content)
-        
-        # Process images (extract alt text)
-        content = re.sub(r'!\[([^\]]*)\]\([^)]+\)', r'[Image: \1]', content)
+        # Convert code, headers, emphasis, links, images, quotes and rules
+        content = self._convert_markdown_inline(content)
         
         # Process tables
         content = self._convert_markdown_tables(content)
@@ -692,24 +1091,20 @@ class DocumentProcessor:
         # Process lists
         content = self._convert_markdown_lists(content)
         
-        # Process blockquotes
-        content = re.sub(r'^>\s+(.+)$', r'Quote: \1', content, flags=re.MULTILINE)
-        
-        # Process horizontal rules
-        content = re.sub(r'^[-*_]{3,}$', r'---', content, flags=re.MULTILINE)
-        
         # Clean up extra whitespace and normalize
-        content = re.sub(r'\n\s*\n', '\n\n', content)
-        content = re.sub(r'[ \t]+', ' ', content)
+        content = _Patterns.BLANK_LINES.sub('\n\n', content)
+        content = _Patterns.WS_MULTI.sub(' ', content)
         content = content.strip()
         
         return content
     
-    def _convert_header(self, match) -> str:
+    def _convert_markdown_inline(self, content: str) -> str:
+        """Convert single-line markdown constructs in one pass over the content."""
+        handlers = self._markdown_handlers
+        return _Patterns.MARKDOWN.sub(lambda m: handlers[m.lastgroup](m), content)
+    
+    def _convert_header(self, level: int, text: str) -> str:
         """Convert markdown header to plain text with hierarchy indication."""
-        level = len(match.group(1))
-        text = match.group(2)
-        
         # Create hierarchy indicator
         if level == 1:
             return f"\n{text}\n{'=' * len(text)}\n"
@@ -721,9 +1116,6 @@ class DocumentProcessor:
     
     def _convert_markdown_tables(self, content: str) -> str:
         """Convert markdown tables to plain text format."""
-        # Find table blocks
-        table_pattern = r'(\|[^\n]*\|[^\n]*\n\|[^\n]*\|[^\n]*\n(\|[^\n]*\|[^\n]*\n)*)'
-        
         def convert_table(match):
             table_text = match.group(1)
             lines = table_text.strip().split('\n')
@@ -759,7 +1151,8 @@ class DocumentProcessor:
             result.append("")  # Add spacing
             return "\n".join(result)
         
-        return re.sub(table_pattern, convert_table, content, flags=re.MULTILINE)
+        # Find table blocks
+        return _Patterns.TABLE.sub(convert_table, content)
     
     def _convert_markdown_lists(self, content: str) -> str:
         """Convert markdown lists to plain text format."""
@@ -770,7 +1163,7 @@ class DocumentProcessor:
         
         for line in lines:
             # Check for list items
-            list_match = re.match(r'^(\s*)([-*+]|\d+\.)\s+(.+)$', line)
+            list_match = _Patterns.LIST_ITEM.match(line)
             
             if list_match:
                 indent = len(list_match.group(1))
@@ -801,107 +1194,162 @@ class DocumentProcessor:
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Remove extra whitespace; line breaks collapse to spaces too, so no
+        # line endings or runs of newlines are left to normalize afterwards
+        text = _Patterns.WHITESPACE.sub(' ', text)
         
-        # Remove control characters except newlines and tabs
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-        
-        # Normalize line endings
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Remove excessive newlines
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        # Remove control characters except newlines and tabs; str.translate
+        # is fastest on ASCII text but slower than the regex otherwise
+        if text.isascii():
+            text = text.translate(_CONTROL_CHARS_DELETE)
+        else:
+            text = _Patterns.CONTROL_CHARS.sub('', text)
         
         # Strip leading/trailing whitespace
-        text = text.strip()
-        
-        return text
+        return text.strip()
     
-    def _generate_chunks(self, text: str, source_file: str) -> List[DocumentChunk]:
+    def _generate_chunks(self, text: str, source_file: str,
+                         created_at: Optional[str] = None) -> List[DocumentChunk]:
         """Generate intelligent text chunks."""
+        return list(self._iter_chunks(text, source_file, created_at))
+    
+    def _iter_chunks(self, text: str, source_file: str,
+                     created_at: Optional[str] = None) -> Iterator[DocumentChunk]:
+        """Yield intelligent text chunks one at a time, all stamped with created_at."""
         if not text:
-            return []
+            return
+        
+        if created_at is None:
+            created_at = datetime.now().isoformat()
         
-        chunks = []
         sentences = self._split_into_sentences(text)
         
         current_chunk = []
         current_length = 0
+        current_words = 0
         chunk_index = 0
         start_char = 0
         
         for sentence in sentences:
-            sentence_length = len(sentence)
+            # current_length is the joined length, so count the separating space
+            sentence_length = len(sentence) + (1 if current_chunk else 0)
+            sentence_words = self._count_words(sentence)
             
             # Check if adding this sentence would exceed max chunk size
             if current_length + sentence_length > self.max_chunk_size and current_chunk:
                 # Create chunk from current sentences
-                chunk_text = ' '.join(current_chunk)
-                chunk = self._create_chunk(
-                    chunk_text, source_file, chunk_index, start_char, 
-                    start_char + len(chunk_text)
+                # current_length is exactly len(chunk_text)
+                yield self._create_chunk(
+                    ' '.join(current_chunk), source_file, chunk_index, start_char, 
+                    start_char + current_length, sentence_count=len(current_chunk),
+                    text_length=current_length, word_count=current_words,
+                    created_at=created_at
                 )
-                chunks.append(chunk)
                 
                 # Start new chunk with overlap
-                overlap_sentences = self._get_overlap_sentences(current_chunk)
+                overlap_sentences, overlap_length = self._get_overlap_sentences(current_chunk)
                 current_chunk = overlap_sentences + [sentence]
-                current_length = sum(len(s) for s in current_chunk)
-                start_char = start_char + len(' '.join(overlap_sentences))
+                current_length = overlap_length + len(sentence) + (1 if overlap_sentences else 0)
+                current_words = sum(self._count_words(s) for s in overlap_sentences) + sentence_words
+                start_char = start_char + overlap_length
                 chunk_index += 1
             else:
                 current_chunk.append(sentence)
                 current_length += sentence_length
+                current_words += sentence_words
         
         # Add final chunk if it meets minimum size
         if current_chunk and current_length >= self.min_chunk_size:
-            chunk_text = ' '.join(current_chunk)
-            chunk = self._create_chunk(
-                chunk_text, source_file, chunk_index, start_char,
-                start_char + len(chunk_text)
+            yield self._create_chunk(
+                ' '.join(current_chunk), source_file, chunk_index, start_char,
+                start_char + current_length, sentence_count=len(current_chunk),
+                text_length=current_length, word_count=current_words,
+                created_at=created_at
             )
-            chunks.append(chunk)
-        
-        return chunks
     
-    def _split_into_sentences(self, text: str) -> List[str]:
-        """Split text into sentences using intelligent boundary detection."""
-        # Basic sentence splitting with common patterns
-        sentence_pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-        sentences = re.split(sentence_pattern, text)
-        
-        # Clean up sentences
-        cleaned_sentences = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence and len(sentence) > 10:  # Minimum sentence length
-                cleaned_sentences.append(sentence)
-        
-        return cleaned_sentences
+    def _count_words(self, sentence: str) -> int:
+        """Count the words of a sentence from normalized text."""
+        # Normalized text only separates words with single spaces, unless a
+        # deleted control character left two behind
+        if '  ' in sentence:
+            return len(sentence.split())
+        return sentence.count(' ') + 1
+    
+    def _split_into_sentences(self, text: str) -> Iterator[str]:
+        """Yield sentences using intelligent boundary detection."""
+        start = 0
+        for end, next_start in self._sentence_breaks(text):
+            # Stripping only shortens, so shorter spans can be skipped unsliced
+            if end - start > 10:
+                sentence = text[start:end].strip()
+                if len(sentence) > 10:  # Minimum sentence length
+                    yield sentence
+            start = next_start
     
-    def _get_overlap_sentences(self, sentences: List[str]) -> List[str]:
-        """Get sentences for overlap based on chunk overlap setting."""
+    def _sentence_breaks(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield the (start, end) span of each sentence break, then the end of the text."""
+        return itertools.chain(
+            (match.span() for match in _Patterns.SENTENCE_BREAK.finditer(text)),
+            ((len(text), len(text)),)
+        )
+    
+    def _count_sentences(self, text: str) -> int:
+        """Count the sentences _split_into_sentences would yield, without building them."""
+        count = 0
+        start = 0
+        for end, next_start in self._sentence_breaks(text):
+            # Only slice and strip when the span could have surrounding whitespace
+            length = end - start
+            if length > 10 and (text[start].isspace() or text[end - 1].isspace()):
+                length = len(text[start:end].strip())
+            if length > 10:  # Minimum sentence length
+                count += 1
+            start = next_start
+        return count
+    
+    def _get_overlap_sentences(self, sentences: List[str]) -> Tuple[List[str], int]:
+        """Get sentences for overlap and their joined length based on chunk overlap setting."""
         if not sentences or self.chunk_overlap <= 0:
-            return []
+            return [], 0
         
-        # Calculate how many sentences to include for overlap
+        # Take sentences from the end while their joined length fits the overlap
         overlap_chars = self.chunk_overlap
         overlap_sentences = []
+        total = 0
         
         for sentence in reversed(sentences):
-            if len(' '.join(overlap_sentences + [sentence])) <= overlap_chars:
-                overlap_sentences.insert(0, sentence)
-            else:
+            # Joining adds one space before every sentence after the first
+            added = len(sentence) + (1 if overlap_sentences else 0)
+            if total + added > overlap_chars:
                 break
+            overlap_sentences.append(sentence)
+            total += added
         
-        return overlap_sentences
+        overlap_sentences.reverse()
+        return overlap_sentences, total
     
     def _create_chunk(self, text: str, source_file: str, chunk_index: int, 
-                     start_char: int, end_char: int) -> DocumentChunk:
-        """Create a document chunk with enhanced metadata."""
-        # Create a more robust chunk ID
-        chunk_hash = hashlib.md5(text.encode()).hexdigest()[:12]
+                     start_char: int, end_char: int,
+                     sentence_count: Optional[int] = None,
+                     text_length: Optional[int] = None,
+                     word_count: Optional[int] = None,
+                     created_at: Optional[str] = None) -> DocumentChunk:
+        """
+        Create a document chunk with enhanced metadata.
+        
+        sentence_count, text_length and word_count can be passed by callers
+        that built the text from known sentences; otherwise they are computed.
+        created_at defaults to the current time.
+        """
+        if sentence_count is None:
+            sentence_count = self._count_sentences(text)
+        if text_length is None:
+            text_length = len(text)
+        if word_count is None:
+            word_count = len(text.split())
+        
+        # Create a more robust chunk ID (6-byte BLAKE2b gives the same 12 hex chars)
+        chunk_hash = hashlib.blake2b(text.encode(), digest_size=6).hexdigest()
         chunk_id = f"{source_file.replace('.', '_')}_{chunk_index:04d}_{chunk_hash}"
         
         # Enhanced chunk metadata
@@ -909,16 +1357,16 @@ class DocumentProcessor:
             'source_file': source_file,
             'chunk_index': chunk_index,
             'chunk_id': chunk_id,
-            'word_count': len(text.split()),
-            'char_count': len(text),
-            'sentence_count': len(self._split_into_sentences(text)),
+            'word_count': word_count,
+            'char_count': text_length,
+            'sentence_count': sentence_count,
             'start_char': start_char,
             'end_char': end_char,
-            'chunk_size': len(text),
-            'created_at': datetime.now().isoformat(),
+            'chunk_size': text_length,
+            'created_at': created_at or datetime.now().isoformat(),
             'chunk_type': 'text',
             'has_content': bool(text.strip()),
-            'content_preview': text[:100] + '...' if len(text) > 100 else text
+            'content_preview': text if text_length <= 100 else f"{text[:100]}..."
         }
         
         return DocumentChunk(
@@ -962,8 +1410,8 @@ class DocumentProcessor:
                 'max_chunk_size': self.max_chunk_size,
                 'chunk_overlap': self.chunk_overlap,
                 'min_chunk_size': self.min_chunk_size,
-                'max_file_size': self.config.document.max_file_size,
-                'max_chunks_per_document': self.config.document.max_chunks_per_document
+                'max_file_size': self._max_file_size,
+                'max_chunks_per_document': self._max_chunks_per_document
             }
         }
     
@@ -1034,6 +1482,9 @@ class DocumentProcessor:
 # Global instance
 _document_processor = None
 
+# Document processor owned by each process_documents worker process
+_worker_document_processor: Optional[DocumentProcessor] = None
+
 
 def get_document_processor(config=None) -> DocumentProcessor:
     """Get or create document processor instance."""
@@ -1047,3 +1498,20 @@ def reset_document_processor():
     """Reset document processor instance."""
     global _document_processor
     _document_processor = None
+
+
+def _init_document_worker(config_values: Dict[str, Dict[str, Any]]):
+    """Create a processor with the parent's configuration in each pool worker."""
+    global _worker_document_processor
+    config = Config.construct_from_env(config_values)
+    config.setup_worker_logging()
+    _worker_document_processor = DocumentProcessor(config)
+
+
+def _process_document_in_worker(file_path: str) -> Union[Tuple[List[DocumentChunk], DocumentMetadata], Exception]:
+    """Process a document with the worker's processor, returning any error instead of raising it."""
+    # Raising would abort the rest of the batch in Executor.map
+    try:
+        return _worker_document_processor.process_document(file_path)
+    except Exception as e:
+        return e
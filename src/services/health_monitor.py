@@ -5,11 +5,17 @@ This module provides continuous health monitoring for all AI services
 with configurable intervals, alerting, and performance tracking.
 """
 
+import itertools
 import logging
+import queue
+import sys
 import threading
 import time
-from typing import Dict, Any, Optional, Callable, List
+from collections import deque
+from operator import attrgetter
+from typing import Dict, Any, Optional, Callable, Deque, List, NamedTuple, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -17,6 +23,18 @@ from .service_factory import ServiceFactory, ServiceStatus
 
 logger = logging.getLogger(__name__)
 
+# Seconds a service factory health check result is reused for
+_HEALTH_CHECK_TTL = 2.0
+
+# Alerts waiting for callback dispatch beyond this are dropped
+_ALERT_QUEUE_SIZE = 1024
+
+# Seconds alerts are kept before _process_alerts drops them (24 hours)
+_ALERT_RETENTION = 24 * 60 * 60
+
+# Service alerts from one check beyond this are announced as a single alert
+_ALERT_BATCH_THRESHOLD = 3
+
 
 class AlertLevel(str, Enum):
     """Alert level enumeration."""
@@ -26,7 +44,17 @@ class AlertLevel(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Logging level and log label for each alert level
+_LOG_LEVEL_BY_ALERT: Dict[AlertLevel, int] = {
+    AlertLevel.INFO: logging.INFO,
+    AlertLevel.WARNING: logging.WARNING,
+    AlertLevel.ERROR: logging.ERROR,
+    AlertLevel.CRITICAL: logging.CRITICAL
+}
+_ALERT_LABELS: Dict[AlertLevel, str] = {level: level.value.upper() for level in AlertLevel}
+
+
+@dataclass(slots=True, frozen=True)
 class HealthAlert:
     """Health alert container."""
     level: AlertLevel
@@ -36,6 +64,19 @@ class HealthAlert:
     details: Dict[str, Any]
 
 
+class HealthRecord(NamedTuple):
+    """One recorded health check."""
+    timestamp: float
+    overall_status: str
+    services: Dict[str, Any]
+    metrics: Dict[str, Any]
+    healthy_services: List[str]
+
+
+# Fields of an alert included in health summaries
+_ALERT_SUMMARY_FIELDS = attrgetter("level", "service_name", "message", "timestamp")
+
+
 class HealthMonitor:
     """
     Continuous health monitoring for ZeroRAG services.
@@ -52,25 +93,47 @@ class HealthMonitor:
                  service_factory: ServiceFactory,
                  check_interval: int = 30,
                  alert_threshold: int = 3,
-                 enable_auto_recovery: bool = True):
+                 enable_auto_recovery: bool = True,
+                 per_check_timeout: float = 5.0):
         """Initialize the health monitor."""
         self.service_factory = service_factory
         self.check_interval = check_interval
         self.alert_threshold = alert_threshold
         self.enable_auto_recovery = enable_auto_recovery
+        self.per_check_timeout = per_check_timeout
         
         # Monitoring state
-        self.is_running = False
         self.monitor_thread: Optional[threading.Thread] = None
-        self.stop_event = threading.Event()
         
-        # Health tracking
-        self.health_history: List[Dict[str, Any]] = []
-        self.alerts: List[HealthAlert] = []
+        # Wakes the monitor loop for stop requests and config changes
+        self._cv = threading.Condition()
+        self._stop = False
+        
+        # Guards the history, alerts, failure counts and callbacks, which the
+        # monitor thread updates while API threads read them
+        self._lock = threading.RLock()
+        
+        # Health tracking (only the last 1000 records and 100 alerts are kept)
+        self.health_history: Deque[HealthRecord] = deque(maxlen=1000)
+        self.alerts: Deque[HealthAlert] = deque(maxlen=100)
         self.service_failure_counts: Dict[str, int] = {}
         
-        # Alert callbacks
-        self.alert_callbacks: List[Callable[[HealthAlert], None]] = []
+        # Overall status of the last 10 checks and how many were healthy
+        self._recent_statuses: Deque[str] = deque(maxlen=10)
+        self._recent_healthy = 0
+        
+        # Last service factory health check as (monotonic time, result)
+        self._health_check_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._health_check_lock = threading.Lock()
+        
+        # Alert callbacks, replaced rather than mutated so the dispatcher can iterate without the lock
+        self.alert_callbacks: Tuple[Callable[[HealthAlert], None], ...] = ()
+        
+        # Callbacks run on a dispatcher thread so slow ones cannot delay checks
+        self._alert_queue: "queue.Queue[Optional[HealthAlert]]" = queue.Queue(maxsize=_ALERT_QUEUE_SIZE)
+        self._alert_dispatcher: Optional[threading.Thread] = None
+        self._alert_dispatcher_stop = threading.Event()
+        self._alert_dispatcher_lock = threading.Lock()
         
         # Performance tracking
         self.start_time = time.time()
@@ -79,6 +142,11 @@ class HealthMonitor:
         
         logger.info(f"Health monitor initialized with {check_interval}s interval")
     
+    @property
+    def is_running(self) -> bool:
+        """Whether the monitor thread is alive."""
+        return self.monitor_thread is not None and self.monitor_thread.is_alive()
+    
     def start_monitoring(self):
         """Start continuous health monitoring."""
         if self.is_running:
@@ -86,8 +154,8 @@ class HealthMonitor:
             return
         
         logger.info("Starting health monitor...")
-        self.is_running = True
-        self.stop_event.clear()
+        with self._cv:
+            self._stop = False
         
         self.monitor_thread = threading.Thread(
             target=self._monitor_loop,
@@ -105,105 +173,176 @@ class HealthMonitor:
             return
         
         logger.info("Stopping health monitor...")
-        self.is_running = False
-        self.stop_event.set()
+        with self._cv:
+            self._stop = True
+            self._cv.notify_all()
         
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=5)
         
+        self._stop_alert_dispatcher()
+        
         logger.info("Health monitor stopped")
     
     def _monitor_loop(self):
         """Main monitoring loop."""
         logger.info("Health monitor loop started")
         
-        while self.is_running and not self.stop_event.is_set():
+        while True:
             try:
-                self._perform_health_check()
-                self._process_alerts()
-                
-                # Wait for next check or stop signal
-                self.stop_event.wait(self.check_interval)
+                # One wall-clock reading serves the whole tick
+                now = time.time()
+                self._perform_health_check(now)
+                self._process_alerts(now)
+                retry = False
                 
             except Exception as e:
                 logger.error(f"Error in health monitor loop: {e}")
                 self.failed_checks += 1
-                time.sleep(1)  # Brief pause before retry
+                retry = True  # Brief pause before retry
+            
+            # Wait for next check or stop signal
+            if self._wait_for_next_check(retry):
+                break
         
         logger.info("Health monitor loop ended")
     
-    def _perform_health_check(self):
-        """Perform a health check and record results."""
+    def _wait_for_next_check(self, retry: bool = False) -> bool:
+        """Block until the next check is due or monitoring is stopped; return True if stopped."""
+        with self._cv:
+            started = time.monotonic()
+            while not self._stop:
+                # Re-read the interval after every wakeup so update_config
+                # takes effect without waiting out the old interval
+                delay = 1 if retry else self.check_interval
+                remaining = started + delay - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cv.wait(remaining)
+            return True
+    
+    def _perform_health_check(self, now: Optional[float] = None):
+        """Perform a health check and record results, stamped with now (defaults to the current time)."""
         self.total_checks += 1
         
         try:
             # Get health status from service factory
-            health_status = self.service_factory.perform_health_check()
+            health_status = self._intern_health_status(self._cached_perform_health_check())
             
             # Record in history
-            health_record = {
-                "timestamp": time.time(),
-                "overall_status": health_status["overall_status"],
-                "services": health_status["services"],
-                "metrics": health_status["metrics"],
-                "healthy_services": health_status["healthy_services"]
-            }
-            
-            self.health_history.append(health_record)
+            health_record = HealthRecord(
+                timestamp=time.time() if now is None else now,
+                overall_status=health_status["overall_status"],
+                services=health_status["services"],
+                metrics=health_status["metrics"],
+                healthy_services=health_status["healthy_services"]
+            )
             
-            # Keep only last 1000 records
-            if len(self.health_history) > 1000:
-                self.health_history = self.health_history[-1000:]
+            with self._lock:
+                self.health_history.append(health_record)
+                self._record_recent_status(health_record.overall_status)
             
             # Check for service issues
             self._check_service_health(health_status)
             
-            logger.debug(f"Health check completed: {health_status['overall_status']}")
+            # Arguments are only formatted if DEBUG records are emitted
+            logger.debug("Health check completed: %s", health_status["overall_status"])
             
         except Exception as e:
             logger.error(f"Health check failed: {e}")
             self.failed_checks += 1
     
+    def _cached_perform_health_check(self) -> Dict[str, Any]:
+        """Run the service factory health check, reusing a result from the last few seconds."""
+        with self._health_check_lock:
+            now = time.monotonic()
+            if self._health_check_cache is not None:
+                checked_at, health_status = self._health_check_cache
+                if now - checked_at < _HEALTH_CHECK_TTL:
+                    return health_status
+            
+            # Bound the wait on slow services; the result is aged from when
+            # the check started
+            health_status = self.service_factory.perform_health_check(timeout=self.per_check_timeout)
+            self._health_check_cache = (now, health_status)
+            return health_status
+    
+    @staticmethod
+    def _intern_health_status(health_status: Dict[str, Any]) -> Dict[str, Any]:
+        """Return health_status with service names and statuses interned."""
+        # The same few names and statuses repeat in every history record,
+        # failure count and alert; interning keeps a single copy of each
+        return {
+            **health_status,
+            "overall_status": sys.intern(health_status["overall_status"]),
+            "services": {
+                sys.intern(name): {**info, "status": sys.intern(info["status"])}
+                for name, info in health_status["services"].items()
+            }
+        }
+    
     def _check_service_health(self, health_status: Dict[str, Any]):
         """Check individual service health and generate alerts."""
+        pending_alerts: List[Tuple[AlertLevel, str, str, Dict[str, Any]]] = []
+        services_to_recover: List[str] = []
+        
         for service_name, service_info in health_status["services"].items():
             status = service_info["status"]
             
             if status == "healthy":
                 # Reset failure count if service is healthy
-                self.service_failure_counts[service_name] = 0
+                with self._lock:
+                    self.service_failure_counts[service_name] = 0
                 
             elif status in ["unhealthy", "error"]:
                 # Increment failure count
-                self.service_failure_counts[service_name] = (
-                    self.service_failure_counts.get(service_name, 0) + 1
-                )
-                
-                failure_count = self.service_failure_counts[service_name]
+                with self._lock:
+                    failure_count = self.service_failure_counts.get(service_name, 0) + 1
+                    self.service_failure_counts[service_name] = failure_count
                 
                 # Generate alert based on failure count
                 if failure_count == 1:
-                    self._create_alert(
+                    pending_alerts.append((
                         AlertLevel.WARNING,
                         service_name,
                         f"Service {service_name} is {status}",
                         service_info
-                    )
+                    ))
                 
                 elif failure_count >= self.alert_threshold:
-                    self._create_alert(
+                    pending_alerts.append((
                         AlertLevel.ERROR,
                         service_name,
                         f"Service {service_name} has been {status} for {failure_count} checks",
                         service_info
-                    )
+                    ))
                     
                     # Attempt auto-recovery
                     if self.enable_auto_recovery:
-                        self._attempt_service_recovery(service_name)
+                        services_to_recover.append(service_name)
+        
+        if len(pending_alerts) > _ALERT_BATCH_THRESHOLD:
+            # Keep every service's alert, but log and notify about them once
+            for level, service_name, message, details in pending_alerts:
+                self._create_alert(level, service_name, message, details, notify=False)
+            
+            service_names = [service_name for _, service_name, _, _ in pending_alerts]
+            self._create_alert(
+                max((level for level, _, _, _ in pending_alerts), key=_LOG_LEVEL_BY_ALERT.__getitem__),
+                "multiple_services",
+                f"{len(service_names)} services need attention: {', '.join(service_names)}",
+                {"services": service_names, "messages": [message for _, _, message, _ in pending_alerts]}
+            )
+        else:
+            for level, service_name, message, details in pending_alerts:
+                self._create_alert(level, service_name, message, details)
+        
+        for service_name in services_to_recover:
+            self._attempt_service_recovery(service_name)
     
-    def _create_alert(self, level: AlertLevel, service_name: str, message: str, details: Dict[str, Any]):
-        """Create and store a health alert."""
+    def _create_alert(self, level: AlertLevel, service_name: str, message: str, details: Dict[str, Any],
+                      notify: bool = True):
+        """Create and store a health alert, logging it and running the callbacks if notify is set."""
         alert = HealthAlert(
             level=level,
             service_name=service_name,
@@ -212,32 +351,81 @@ class HealthMonitor:
             details=details
         )
         
-        self.alerts.append(alert)
+        with self._lock:
+            self.alerts.append(alert)
         
-        # Keep only last 100 alerts
-        if len(self.alerts) > 100:
-            self.alerts = self.alerts[-100:]
+        if not notify:
+            return
         
         # Log alert
-        log_level = {
-            AlertLevel.INFO: logging.INFO,
-            AlertLevel.WARNING: logging.WARNING,
-            AlertLevel.ERROR: logging.ERROR,
-            AlertLevel.CRITICAL: logging.CRITICAL
-        }[level]
-        
-        logger.log(log_level, f"Health Alert [{level.value.upper()}] {service_name}: {message}")
+        logger.log(
+            _LOG_LEVEL_BY_ALERT[level], "Health Alert [%s] %s: %s",
+            _ALERT_LABELS[level], service_name, message
+        )
         
-        # Call alert callbacks
-        for callback in self.alert_callbacks:
+        # Hand the alert to the callback dispatcher
+        self._dispatch_alert(alert)
+    
+    def _dispatch_alert(self, alert: HealthAlert):
+        """Queue an alert for the callbacks, starting the dispatcher thread if needed."""
+        with self._alert_dispatcher_lock:
+            if self._alert_dispatcher is None or not self._alert_dispatcher.is_alive():
+                # Each dispatcher gets its own stop event, so one still
+                # finishing after a stop is never restarted by mistake
+                self._alert_dispatcher_stop = threading.Event()
+                self._alert_dispatcher = threading.Thread(
+                    target=self._alert_dispatch_loop,
+                    args=(self._alert_dispatcher_stop,),
+                    daemon=True,
+                    name="HealthAlertDispatcher"
+                )
+                self._alert_dispatcher.start()
+            
             try:
-                callback(alert)
-            except Exception as e:
-                logger.error(f"Alert callback failed: {e}")
+                self._alert_queue.put_nowait(alert)
+            except queue.Full:
+                logger.warning(f"Alert queue full, dropping alert for {alert.service_name}")
+    
+    def _alert_dispatch_loop(self, stop: threading.Event):
+        """Run the alert callbacks for queued alerts until stop is set and the queue is empty."""
+        while True:
+            try:
+                # Once stopping, drain what is queued without waiting for more
+                alert = self._alert_queue.get(block=not stop.is_set())
+            except queue.Empty:
+                break
+            if alert is None:
+                # Wake-up from _stop_alert_dispatcher
+                continue
+            
+            for callback in self.alert_callbacks:
+                try:
+                    callback(alert)
+                except Exception as e:
+                    logger.error(f"Alert callback failed: {e}")
+    
+    def _stop_alert_dispatcher(self):
+        """Let the dispatcher finish the queued alerts, then stop it."""
+        with self._alert_dispatcher_lock:
+            dispatcher, self._alert_dispatcher = self._alert_dispatcher, None
+            stop = self._alert_dispatcher_stop
+        if dispatcher is None or not dispatcher.is_alive():
+            return
+        
+        # Signal outside the lock and without blocking on a full queue, so a
+        # callback that raises an alert cannot deadlock the shutdown
+        stop.set()
+        try:
+            # Wake the dispatcher if it is waiting on an empty queue
+            self._alert_queue.put_nowait(None)
+        except queue.Full:
+            # It is busy with queued alerts and sees the stop when they run out
+            pass
+        dispatcher.join(timeout=5)
     
     def _attempt_service_recovery(self, service_name: str):
         """Attempt to recover a failed service."""
-        logger.info(f"Attempting to recover service: {service_name}")
+        logger.info("Attempting to recover service: %s", service_name)
         
         try:
             success = self.service_factory.restart_service(service_name)
@@ -250,7 +438,8 @@ class HealthMonitor:
                     {"recovery_attempt": True}
                 )
                 # Reset failure count
-                self.service_failure_counts[service_name] = 0
+                with self._lock:
+                    self.service_failure_counts[service_name] = 0
             else:
                 self._create_alert(
                     AlertLevel.CRITICAL,
@@ -268,27 +457,31 @@ class HealthMonitor:
                 {"recovery_error": str(e)}
             )
     
-    def _process_alerts(self):
-        """Process and clean up old alerts."""
-        current_time = time.time()
-        cutoff_time = current_time - (24 * 60 * 60)  # 24 hours
-        
-        # Remove old alerts
-        self.alerts = [
-            alert for alert in self.alerts
-            if alert.timestamp > cutoff_time
-        ]
+    def _process_alerts(self, now: Optional[float] = None):
+        """Process and clean up old alerts as of now (defaults to the current time)."""
+        cutoff_time = (time.time() if now is None else now) - _ALERT_RETENTION
+        
+        # Alerts are in time order, so only the oldest can have expired and
+        # a tick with nothing to remove only looks at the first alert
+        with self._lock:
+            alerts = self.alerts
+            while alerts and alerts[0].timestamp <= cutoff_time:
+                alerts.popleft()
     
     def add_alert_callback(self, callback: Callable[[HealthAlert], None]):
         """Add an alert callback function."""
-        self.alert_callbacks.append(callback)
+        with self._lock:
+            self.alert_callbacks = self.alert_callbacks + (callback,)
         logger.info("Alert callback added")
     
     def remove_alert_callback(self, callback: Callable[[HealthAlert], None]):
         """Remove an alert callback function."""
-        if callback in self.alert_callbacks:
-            self.alert_callbacks.remove(callback)
-            logger.info("Alert callback removed")
+        with self._lock:
+            if callback not in self.alert_callbacks:
+                return
+            index = self.alert_callbacks.index(callback)
+            self.alert_callbacks = self.alert_callbacks[:index] + self.alert_callbacks[index + 1:]
+        logger.info("Alert callback removed")
     
     def get_health_summary(self) -> Dict[str, Any]:
         """Get a comprehensive health summary."""
@@ -303,23 +496,30 @@ class HealthMonitor:
             if self.total_checks > 0 else 1.0
         )
         
-        # Get current health status
-        current_health = self.service_factory.perform_health_check()
+        # Snapshot the shared state once, then build the summary outside the lock
+        with self._lock:
+            last_record = self.health_history[-1] if self.health_history else None
+            last_alerts = self._last(self.alerts, 10)
+            service_failures = dict(self.service_failure_counts)
+            health_trend = self._calculate_health_trend()
+        
+        # Reuse the monitor's last check while it is fresh, otherwise probe the services
+        if last_record is not None and current_time - last_record.timestamp < self.check_interval:
+            current_health = last_record._asdict()
+        else:
+            current_health = self._cached_perform_health_check()
         
         # Get recent alerts
         recent_alerts = [
             {
-                "level": alert.level.value,
-                "service": alert.service_name,
-                "message": alert.message,
-                "timestamp": alert.timestamp
+                "level": level.value,
+                "service": service_name,
+                "message": message,
+                "timestamp": timestamp
             }
-            for alert in self.alerts[-10:]  # Last 10 alerts
+            for level, service_name, message, timestamp in map(_ALERT_SUMMARY_FIELDS, last_alerts)
         ]
         
-        # Get health trends
-        health_trend = self._calculate_health_trend()
-        
         return {
             "monitor_status": {
                 "is_running": self.is_running,
@@ -330,45 +530,66 @@ class HealthMonitor:
                 "check_interval": self.check_interval
             },
             "current_health": current_health,
-            "service_failures": self.service_failure_counts,
+            "service_failures": service_failures,
             "recent_alerts": recent_alerts,
             "health_trend": health_trend,
             "timestamp": current_time
         }
     
+    def _record_recent_status(self, overall_status: str):
+        """Add a check's overall status to the last-10 window used for trends."""
+        recent = self._recent_statuses
+        if len(recent) == recent.maxlen and recent[0] == "healthy":
+            # The oldest status is about to be evicted
+            self._recent_healthy -= 1
+        recent.append(overall_status)
+        if overall_status == "healthy":
+            self._recent_healthy += 1
+    
     def _calculate_health_trend(self) -> Dict[str, Any]:
         """Calculate health trends over time."""
-        if len(self.health_history) < 2:
+        total_count = len(self._recent_statuses)
+        if total_count < 2:
             return {"trend": "insufficient_data"}
         
-        # Get last 10 health checks
-        recent_checks = self.health_history[-10:]
-        
-        # Count healthy vs unhealthy checks
-        healthy_count = sum(
-            1 for check in recent_checks
-            if check["overall_status"] == "healthy"
-        )
-        
-        unhealthy_count = len(recent_checks) - healthy_count
-        
-        # Determine trend
-        if healthy_count == len(recent_checks):
-            trend = "stable_healthy"
-        elif unhealthy_count == len(recent_checks):
-            trend = "stable_unhealthy"
-        elif healthy_count > unhealthy_count:
-            trend = "improving"
-        else:
-            trend = "declining"
+        # Healthy vs unhealthy counts of the last 10 health checks
+        healthy_count = self._recent_healthy
+        unhealthy_count = total_count - healthy_count
         
         return {
-            "trend": trend,
+            "trend": self._label(healthy_count, total_count),
             "healthy_checks": healthy_count,
             "unhealthy_checks": unhealthy_count,
-            "total_checks": len(recent_checks)
+            "total_checks": total_count
         }
     
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _label(healthy: int, total: int) -> str:
+        """Trend label for healthy out of total recent checks."""
+        unhealthy = total - healthy
+        if healthy == total:
+            return "stable_healthy"
+        if unhealthy == total:
+            return "stable_unhealthy"
+        if healthy > unhealthy:
+            return "improving"
+        return "declining"
+    
+    @staticmethod
+    def _last(items: Deque, count: int) -> List:
+        """Return the last count items of a deque, oldest first."""
+        return list(itertools.islice(items, max(0, len(items) - count), None))
+    
+    @staticmethod
+    def _since(items: Deque, cutoff_time: float) -> List:
+        """Return the items stamped at or after cutoff_time, oldest first."""
+        # Items are appended in time order, so scan back from the newest and
+        # stop at the first one older than the cutoff
+        recent = list(itertools.takewhile(lambda item: item.timestamp >= cutoff_time, reversed(items)))
+        recent.reverse()
+        return recent
+    
     def get_alerts(self, 
                    level: Optional[AlertLevel] = None,
                    service_name: Optional[str] = None,
@@ -377,10 +598,8 @@ class HealthMonitor:
         current_time = time.time()
         cutoff_time = current_time - (hours * 60 * 60)
         
-        filtered_alerts = [
-            alert for alert in self.alerts
-            if alert.timestamp >= cutoff_time
-        ]
+        with self._lock:
+            filtered_alerts = self._since(self.alerts, cutoff_time)
         
         if level:
             filtered_alerts = [
@@ -401,25 +620,31 @@ class HealthMonitor:
         current_time = time.time()
         cutoff_time = current_time - (hours * 60 * 60)
         
-        return [
-            record for record in self.health_history
-            if record["timestamp"] >= cutoff_time
-        ]
+        with self._lock:
+            records = self._since(self.health_history, cutoff_time)
+        
+        # Records are tuples internally; callers get the usual dicts
+        return [record._asdict() for record in records]
     
     def clear_alerts(self):
         """Clear all stored alerts."""
-        self.alerts.clear()
+        with self._lock:
+            self.alerts.clear()
         logger.info("All alerts cleared")
     
     def clear_health_history(self):
         """Clear health history."""
-        self.health_history.clear()
+        with self._lock:
+            self.health_history.clear()
+            self._recent_statuses.clear()
+            self._recent_healthy = 0
         logger.info("Health history cleared")
     
     def update_config(self, 
                      check_interval: Optional[int] = None,
                      alert_threshold: Optional[int] = None,
-                     enable_auto_recovery: Optional[bool] = None):
+                     enable_auto_recovery: Optional[bool] = None,
+                     per_check_timeout: Optional[float] = None):
         """Update monitor configuration."""
         if check_interval is not None:
             self.check_interval = check_interval
@@ -432,6 +657,14 @@ class HealthMonitor:
         if enable_auto_recovery is not None:
             self.enable_auto_recovery = enable_auto_recovery
             logger.info(f"Auto recovery {'enabled' if enable_auto_recovery else 'disabled'}")
+        
+        if per_check_timeout is not None:
+            self.per_check_timeout = per_check_timeout
+            logger.info(f"Per-check timeout updated to {per_check_timeout}s")
+        
+        # Let a waiting monitor loop pick up the new interval
+        with self._cv:
+            self._cv.notify_all()
 
 
 # Global health monitor instance
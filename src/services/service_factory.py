@@ -8,6 +8,8 @@ configuration, and lifecycle management with comprehensive error handling.
 import logging
 import threading
 import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from enum import Enum
@@ -27,6 +29,15 @@ from .rag_pipeline import RAGPipeline
 logger = logging.getLogger(__name__)
 
 
+# Names used for each probed service in health check logs
+_SERVICE_LABELS = {
+    "embedding": "Embedding service",
+    "llm": "LLM service",
+    "document_processor": "Document processor",
+    "vector_store": "Vector store",
+}
+
+
 class ServiceStatus(str, Enum):
     """Service status enumeration."""
     INITIALIZING = "initializing"
@@ -72,8 +83,17 @@ class ServiceFactory:
         
         # Service status tracking
         self.services: Dict[str, ServiceInfo] = {}
+        self._services_snapshot: Optional[Dict[str, Dict[str, Any]]] = None
         self.initialization_lock = threading.Lock()
         self.health_check_lock = threading.Lock()
+        self._health_check_pool = ThreadPoolExecutor(
+            max_workers=len(_SERVICE_LABELS), thread_name_prefix="health-check"
+        )
+        # Last probe submitted per service, so a hung probe is never queued again
+        self._health_probes: Dict[str, Future] = {}
+        # Factories dropped without shutdown(), such as per-request ones, still
+        # release their health check workers
+        weakref.finalize(self, self._health_check_pool.shutdown, wait=False, cancel_futures=True)
         
         # Performance tracking
         self.total_requests = 0
@@ -116,6 +136,7 @@ class ServiceFactory:
                 
                 # Initialize RAG pipeline
                 self._initialize_rag_pipeline()
+                self._invalidate_services_snapshot()
                 
                 # Mark as initialized
                 self._initialized = True
@@ -294,102 +315,58 @@ class ServiceFactory:
                 initialization_time=None
             )
     
-    def _perform_health_check(self):
-        """Perform health check on all services."""
+    def _perform_health_check(self, timeout: Optional[float] = None):
+        """
+        Perform health check on all services.
+        
+        The service probes run concurrently, so a check takes as long as the
+        slowest service rather than the sum of all of them. Services that have
+        not answered within timeout seconds are marked as errors.
+        """
         with self.health_check_lock:
             logger.info("Performing health check on all services...")
             
-            # Check embedding service
+            probes = {}
             if self.embedding_service:
-                try:
-                    health = self.embedding_service.health_check()
-                    self.services["embedding"].health_data = health
-                    self.services["embedding"].status = (
-                        ServiceStatus.HEALTHY if health.get("status") == "healthy" 
-                        else ServiceStatus.UNHEALTHY
-                    )
-                    self.services["embedding"].last_check = time.time()
-                    
-                    if self.services["embedding"].status == ServiceStatus.HEALTHY:
-                        logger.info("Embedding service is healthy")
-                    else:
-                        logger.warning(f"Embedding service is unhealthy: {health}")
-                        
-                except Exception as e:
-                    logger.error(f"Embedding service health check failed: {e}")
-                    self.services["embedding"].status = ServiceStatus.ERROR
-                    self.services["embedding"].health_data = {"error": str(e)}
-                    self.services["embedding"].error_count += 1
-                    self.services["embedding"].last_check = time.time()
-            
-            # Check LLM service
+                probes["embedding"] = self.embedding_service.health_check
             if self.llm_service:
-                try:
-                    health = self.llm_service.health_check()
-                    self.services["llm"].health_data = health
-                    self.services["llm"].status = (
-                        ServiceStatus.HEALTHY if health.get("status") == "healthy" 
-                        else ServiceStatus.UNHEALTHY
-                    )
-                    self.services["llm"].last_check = time.time()
-                    
-                    if self.services["llm"].status == ServiceStatus.HEALTHY:
-                        logger.info("LLM service is healthy")
-                    else:
-                        logger.warning(f"LLM service is unhealthy: {health}")
-                        
-                except Exception as e:
-                    logger.error(f"LLM service health check failed: {e}")
-                    self.services["llm"].status = ServiceStatus.ERROR
-                    self.services["llm"].health_data = {"error": str(e)}
-                    self.services["llm"].error_count += 1
-                    self.services["llm"].last_check = time.time()
-            
-            # Check document processor
+                probes["llm"] = self.llm_service.health_check
             if self.document_processor:
-                try:
-                    health = self.document_processor.health_check()
-                    self.services["document_processor"].health_data = health
-                    self.services["document_processor"].status = (
-                        ServiceStatus.HEALTHY if health.get("status") == "healthy" 
-                        else ServiceStatus.UNHEALTHY
-                    )
-                    self.services["document_processor"].last_check = time.time()
-                    
-                    if self.services["document_processor"].status == ServiceStatus.HEALTHY:
-                        logger.info("Document processor is healthy")
-                    else:
-                        logger.warning(f"Document processor is unhealthy: {health}")
-                        
-                except Exception as e:
-                    logger.error(f"Document processor health check failed: {e}")
-                    self.services["document_processor"].status = ServiceStatus.ERROR
-                    self.services["document_processor"].health_data = {"error": str(e)}
-                    self.services["document_processor"].error_count += 1
-                    self.services["document_processor"].last_check = time.time()
-            
-            # Check vector store
+                probes["document_processor"] = self.document_processor.health_check
             if self.vector_store:
-                try:
-                    health = self.vector_store.get_health_status()
-                    self.services["vector_store"].health_data = health
-                    self.services["vector_store"].status = (
-                        ServiceStatus.HEALTHY if health.get("status") == "healthy" 
-                        else ServiceStatus.UNHEALTHY
+                probes["vector_store"] = self.vector_store.get_health_status
+            
+            futures = {}
+            for name, probe in probes.items():
+                previous = self._health_probes.get(name)
+                if previous is not None and not previous.done():
+                    # Report the service instead of queueing behind its hung probe
+                    self._record_service_error(
+                        name,
+                        f"{_SERVICE_LABELS[name]} health check is still running from a previous check",
+                        "previous health check still running"
+                    )
+                    continue
+                future = self._health_check_pool.submit(probe)
+                self._health_probes[name] = future
+                futures[future] = name
+            pending = set(futures.values())
+            try:
+                for future in as_completed(futures, timeout=timeout):
+                    name = futures[future]
+                    pending.discard(name)
+                    try:
+                        self._record_service_health(name, future.result())
+                    except Exception as e:
+                        self._record_service_error(name, f"{_SERVICE_LABELS[name]} health check failed: {e}", str(e))
+            except FuturesTimeoutError:
+                # Late results are discarded; the probes finish in the background
+                for name in pending:
+                    self._record_service_error(
+                        name,
+                        f"{_SERVICE_LABELS[name]} health check timed out after {timeout}s",
+                        "health check timed out"
                     )
-                    self.services["vector_store"].last_check = time.time()
-                    
-                    if self.services["vector_store"].status == ServiceStatus.HEALTHY:
-                        logger.info("Vector store is healthy")
-                    else:
-                        logger.warning(f"Vector store is unhealthy: {health}")
-                        
-                except Exception as e:
-                    logger.error(f"Vector store health check failed: {e}")
-                    self.services["vector_store"].status = ServiceStatus.ERROR
-                    self.services["vector_store"].health_data = {"error": str(e)}
-                    self.services["vector_store"].error_count += 1
-                    self.services["vector_store"].last_check = time.time()
             
             # Check RAG pipeline (skip during initialization to avoid infinite loop)
             if self.rag_pipeline:
@@ -402,11 +379,33 @@ class ServiceFactory:
                     logger.info("RAG pipeline is available")
                         
                 except Exception as e:
-                    logger.error(f"RAG pipeline check failed: {e}")
-                    self.services["rag_pipeline"].status = ServiceStatus.ERROR
-                    self.services["rag_pipeline"].health_data = {"error": str(e)}
-                    self.services["rag_pipeline"].error_count += 1
-                    self.services["rag_pipeline"].last_check = time.time()
+                    self._record_service_error("rag_pipeline", f"RAG pipeline check failed: {e}", str(e))
+            
+            self._invalidate_services_snapshot()
+    
+    def _record_service_health(self, name: str, health: Dict[str, Any]):
+        """Store the result of a service's health probe."""
+        service_info = self.services[name]
+        service_info.health_data = health
+        service_info.status = (
+            ServiceStatus.HEALTHY if health.get("status") == "healthy" 
+            else ServiceStatus.UNHEALTHY
+        )
+        service_info.last_check = time.time()
+        
+        if service_info.status == ServiceStatus.HEALTHY:
+            logger.info(f"{_SERVICE_LABELS[name]} is healthy")
+        else:
+            logger.warning(f"{_SERVICE_LABELS[name]} is unhealthy: {health}")
+    
+    def _record_service_error(self, name: str, message: str, error: str):
+        """Mark a service as failed after its health probe raised or timed out."""
+        logger.error(message)
+        service_info = self.services[name]
+        service_info.status = ServiceStatus.ERROR
+        service_info.health_data = {"error": error}
+        service_info.error_count += 1
+        service_info.last_check = time.time()
     
     def get_embedding_service(self) -> Optional[EmbeddingService]:
         """Get the embedding service if available and healthy."""
@@ -441,6 +440,31 @@ class ServiceFactory:
             return self.rag_pipeline
         return None
     
+    def _invalidate_services_snapshot(self):
+        """Mark the cached services snapshot as stale after a service changes."""
+        self._services_snapshot = None
+    
+    def get_services_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get status, error count and last check time for every service.
+        
+        The result is cached and only rebuilt after a service's state changes,
+        so frequent metrics polling does not rebuild it on every request. The
+        returned dict is shared and must not be mutated by callers.
+        """
+        snapshot = self._services_snapshot
+        if snapshot is None:
+            snapshot = {
+                name: {
+                    "status": info.status.value,
+                    "error_count": info.error_count,
+                    "last_check": info.last_check
+                }
+                for name, info in self.services.items()
+            }
+            self._services_snapshot = snapshot
+        return snapshot
+    
     def get_service_status(self, service_name: str) -> Optional[ServiceInfo]:
         """Get status information for a specific service."""
         return self.services.get(service_name)
@@ -468,9 +492,14 @@ class ServiceFactory:
             if info.status == ServiceStatus.HEALTHY
         ]
     
-    def perform_health_check(self) -> Dict[str, Any]:
-        """Perform health check and return comprehensive status."""
-        self._perform_health_check()
+    def perform_health_check(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Perform health check and return comprehensive status.
+        
+        Args:
+            timeout: Seconds to wait for the service probes (None waits for all)
+        """
+        self._perform_health_check(timeout)
         
         # Calculate overall metrics
         total_requests = self.total_requests
@@ -511,20 +540,24 @@ class ServiceFactory:
             self.failed_requests += 1
             if service_name in self.services:
                 self.services[service_name].error_count += 1
+                self._invalidate_services_snapshot()
     
     def restart_service(self, service_name: str) -> bool:
         """Attempt to restart a failed service."""
         logger.info(f"Attempting to restart service: {service_name}")
         
         if service_name == "embedding":
-            return self._restart_embedding_service()
+            restarted = self._restart_embedding_service()
         elif service_name == "llm":
-            return self._restart_llm_service()
+            restarted = self._restart_llm_service()
         elif service_name == "document_processor":
-            return self._restart_document_processor()
+            restarted = self._restart_document_processor()
         else:
             logger.error(f"Unknown service: {service_name}")
             return False
+        
+        self._invalidate_services_snapshot()
+        return restarted
     
     def _restart_embedding_service(self) -> bool:
         """Restart the embedding service."""
@@ -656,8 +689,12 @@ class ServiceFactory:
             del self.llm_service
             self.llm_service = None
         
+        # Stop the health check workers without waiting for hung probes
+        self._health_check_pool.shutdown(wait=False, cancel_futures=True)
+        
         # Clear service registry
         self.services.clear()
+        self._invalidate_services_snapshot()
         
         logger.info("ZeroRAG services shutdown completed")
 
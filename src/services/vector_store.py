@@ -1576,12 +1576,15 @@ class VectorStoreService:
             if not self._check_health():
                 raise ConnectionError("Vector store not connected")
             
-            # Get documents from Qdrant
+            # Get documents from Qdrant, fetching only the fields used for grouping
             search_results = self.client.scroll(
                 collection_name=self.collection_name,
                 limit=limit,
                 offset=offset,
-                with_payload=True
+                with_payload=models.PayloadSelectorInclude(
+                    include=["source_file", "created_at", "updated_at", "metadata"]
+                ),
+                with_vectors=False
             )[0]
             
             # Group by source file
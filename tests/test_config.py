@@ -5,6 +5,8 @@ Test suite for ZeroRAG configuration management.
 import os
 import tempfile
 import json
+import logging
+import logging.handlers
 import pytest
 from pathlib import Path
 from unittest.mock import patch
@@ -13,10 +15,11 @@ from unittest.mock import patch
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import config as config_module
 from config import (
     Config, DatabaseConfig, AIModelConfig, APIConfig, DocumentConfig,
     RAGConfig, PerformanceConfig, LoggingConfig, MonitoringConfig,
-    DevelopmentConfig, StorageConfig, get_config, reload_config
+    DevelopmentConfig, StorageConfig, Settings, JsonFormatter, get_config, reload_config
 )
 
 
@@ -44,7 +47,7 @@ class TestDatabaseConfig:
             'REDIS_HOST': 'redis-host',
             'REDIS_PORT': '6380'
         }):
-            config = DatabaseConfig()
+            config = Settings().database
             
             assert config.qdrant_host == "custom-host"
             assert config.qdrant_port == 6334
@@ -53,15 +56,15 @@ class TestDatabaseConfig:
     
     def test_validation_vector_size(self):
         """Test vector size validation."""
-        with pytest.raises(ValueError, match="Vector size must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             DatabaseConfig(qdrant_vector_size=0)
         
-        with pytest.raises(ValueError, match="Vector size must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             DatabaseConfig(qdrant_vector_size=-1)
     
     def test_validation_cache_ttl(self):
         """Test cache TTL validation."""
-        with pytest.raises(ValueError, match="Cache TTL must be non-negative"):
+        with pytest.raises(ValueError, match="greater than or equal to 0"):
             DatabaseConfig(redis_cache_ttl=-1)
 
 
@@ -78,21 +81,22 @@ class TestAIModelConfig:
         assert config.embedding_model_name == "sentence-transformers/all-MiniLM-L6-v2"
         assert config.embedding_device == "cpu"
         assert config.embedding_batch_size == 32
+        assert config.embedding_workers == 2
     
     def test_temperature_validation(self):
         """Test temperature validation."""
-        with pytest.raises(ValueError, match="Temperature must be between 0.0 and 2.0"):
+        with pytest.raises(ValueError, match="less than or equal to 2"):
             AIModelConfig(ollama_temperature=2.1)
         
-        with pytest.raises(ValueError, match="Temperature must be between 0.0 and 2.0"):
+        with pytest.raises(ValueError, match="greater than or equal to 0"):
             AIModelConfig(ollama_temperature=-0.1)
     
     def test_batch_size_validation(self):
         """Test batch size validation."""
-        with pytest.raises(ValueError, match="Batch size must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             AIModelConfig(embedding_batch_size=0)
         
-        with pytest.raises(ValueError, match="Batch size must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             AIModelConfig(embedding_batch_size=-1)
 
 
@@ -112,10 +116,10 @@ class TestAPIConfig:
     
     def test_port_validation(self):
         """Test port validation."""
-        with pytest.raises(ValueError, match="Port must be between 1 and 65535"):
+        with pytest.raises(ValueError, match="greater than or equal to 1"):
             APIConfig(port=0)
         
-        with pytest.raises(ValueError, match="Port must be between 1 and 65535"):
+        with pytest.raises(ValueError, match="less than or equal to 65535"):
             APIConfig(port=65536)
     
     def test_cors_origins_parsing(self):
@@ -141,18 +145,23 @@ class TestDocumentConfig:
         config = DocumentConfig()
         
         assert config.max_file_size == "50MB"
-        assert config.supported_formats == ["txt", "csv", "md"]
+        assert config.supported_formats == frozenset({"txt", "csv", "md"})
         assert config.chunk_size == 1000
         assert config.chunk_overlap == 200
         assert config.max_chunks_per_document == 1000
+        assert config.chunk_cache_size == 128
     
     def test_supported_formats_parsing(self):
         """Test supported formats parsing."""
         config = DocumentConfig(supported_formats="txt,csv,md,pdf")
-        assert config.supported_formats == ["txt", "csv", "md", "pdf"]
+        assert config.supported_formats == frozenset({"txt", "csv", "md", "pdf"})
         
-        # Test that the field is properly converted to list by the validator
-        assert isinstance(config.supported_formats, list)
+        # Test that the field is properly converted to frozenset by the validator
+        assert isinstance(config.supported_formats, frozenset)
+        
+        # Test JSON array parsing with normalization
+        config = DocumentConfig(supported_formats='["TXT", " md"]')
+        assert config.supported_formats == frozenset({"txt", "md"})
     
     def test_file_size_validation(self):
         """Test file size validation."""
@@ -162,6 +171,12 @@ class TestDocumentConfig:
         with pytest.raises(ValueError, match="File size must be positive"):
             DocumentConfig(max_file_size="-1MB")
     
+    def test_max_file_size_bytes(self):
+        """Test max file size is exposed in bytes."""
+        assert DocumentConfig().max_file_size_bytes == 50 * 1024 * 1024
+        assert DocumentConfig(max_file_size="512KB").max_file_size_bytes == 512 * 1024
+        assert DocumentConfig(max_file_size="1GB").max_file_size_bytes == 1024 ** 3
+    
     def test_chunk_overlap_validation(self):
         """Test chunk overlap validation."""
         with pytest.raises(ValueError, match="Chunk overlap must be less than chunk size"):
@@ -185,18 +200,18 @@ class TestRAGConfig:
     
     def test_similarity_threshold_validation(self):
         """Test similarity threshold validation."""
-        with pytest.raises(ValueError, match="Similarity threshold must be between 0.0 and 1.0"):
+        with pytest.raises(ValueError, match="less than or equal to 1"):
             RAGConfig(similarity_threshold=1.1)
         
-        with pytest.raises(ValueError, match="Similarity threshold must be between 0.0 and 1.0"):
+        with pytest.raises(ValueError, match="greater than or equal to 0"):
             RAGConfig(similarity_threshold=-0.1)
     
     def test_top_k_validation(self):
         """Test top K validation."""
-        with pytest.raises(ValueError, match="Top K results must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             RAGConfig(top_k_results=0)
         
-        with pytest.raises(ValueError, match="Top K results must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             RAGConfig(top_k_results=-1)
 
 
@@ -309,6 +324,56 @@ class TestMainConfig:
         assert isinstance(config.development, DevelopmentConfig)
         assert isinstance(config.storage, StorageConfig)
     
+    def test_bootstrap_creates_directories(self):
+        """Test directories are only created once the config is bootstrapped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = os.path.join(temp_dir, "data")
+            with patch.dict(os.environ, {
+                'DATA_DIR': data_dir,
+                'UPLOAD_DIR': os.path.join(data_dir, "uploads"),
+                'PROCESSED_DIR': os.path.join(data_dir, "processed"),
+                'CACHE_DIR': os.path.join(data_dir, "cache"),
+                'LOG_FILE': ''
+            }):
+                config = Config()
+                assert config.storage.data_dir == data_dir
+                assert not os.path.exists(data_dir)
+                
+                assert config.bootstrap() is config
+                assert os.path.exists(config.storage.upload_dir)
+    
+    def test_sections_are_frozen(self):
+        """Test configuration sections are read-only."""
+        config = Config()
+        with pytest.raises(ValueError, match="frozen"):
+            config.database.qdrant_host = "other-host"
+    
+    def test_construct_from_env(self):
+        """Test building a configuration from trusted section values."""
+        values = Config().to_dict()
+        values["database"]["qdrant_host"] = "watched-host"
+        
+        config = Config.construct_from_env(values)
+        assert config.database.qdrant_host == "watched-host"
+        assert isinstance(config.document.supported_formats, frozenset)
+        assert config.document.supported_formats == frozenset({"txt", "csv", "md"})
+        assert config.to_dict() == values
+        
+        # Computed values are derived again rather than copied
+        values["document"]["max_file_size"] = "1MB"
+        values["document"]["max_file_size_bytes"] = 1
+        config = Config.construct_from_env(values)
+        assert config.document.max_file_size_bytes == 1024 * 1024
+    
+    def test_construct_from_env_validates_outside_development(self):
+        """Test values are validated outside the development environment."""
+        values = Config().to_dict()
+        values["development"]["environment"] = "production"
+        values["api"]["port"] = 0
+        
+        with pytest.raises(ValueError):
+            Config.construct_from_env(values)
+    
     def test_config_validation(self):
         """Test configuration validation."""
         config = Config()
@@ -341,6 +406,21 @@ class TestMainConfig:
         assert connections["qdrant"] == "http://localhost:6333"
         assert connections["redis"] == "redis://localhost:6379/0"
     
+    def test_settings_flat_environment_names(self):
+        """Test sections are loaded from flat environment and .env names."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            env_file = os.path.join(temp_dir, ".env")
+            with open(env_file, "w") as f:
+                f.write("QDRANT_HOST=file-host\nCHUNK_SIZE=500\nUNRELATED_SETTING=1\n")
+            
+            with patch.dict(os.environ, {'QDRANT_HOST': 'env-host'}):
+                settings = Settings(_env_file=env_file)
+            
+            # Environment variables take priority over the .env file
+            assert settings.database.qdrant_host == "env-host"
+            assert settings.document.chunk_size == 500
+            assert settings.rag.top_k_results == 5
+    
     def test_environment_file_loading(self):
         """Test environment file loading."""
         # Skip this test for now as it requires more complex environment isolation
@@ -348,6 +428,21 @@ class TestMainConfig:
         pass
 
 
+class TestJsonFormatter:
+    """Test JSON log formatting."""
+    
+    def test_message_is_escaped(self):
+        """Test records with quotes still produce valid JSON."""
+        record = logging.LogRecord(
+            "zero_rag.test", logging.INFO, __file__, 1, 'Loaded "%s"', ("doc.txt",), None
+        )
+        entry = json.loads(JsonFormatter().format(record))
+        
+        assert entry["level"] == "INFO"
+        assert entry["module"] == "zero_rag.test"
+        assert entry["message"] == 'Loaded "doc.txt"'
+
+
 class TestConfigFunctions:
     """Test configuration utility functions."""
     
@@ -366,6 +461,65 @@ class TestConfigFunctions:
         # Test that subsequent calls return the new instance
         config3 = get_config()
         assert config3 is config2
+    
+    def test_logging_configured_once(self):
+        """Test logging handlers are not rebuilt on repeated setup."""
+        config = get_config()
+        root_logger = logging.getLogger()
+        handlers = list(root_logger.handlers)
+        
+        Config().bootstrap()
+        assert root_logger.handlers == handlers
+        
+        config._setup_logging(force=True)
+        assert root_logger.handlers != handlers
+    
+    def test_logging_uses_queue_handler(self):
+        """Test the root logger hands records to a background listener."""
+        config = get_config()
+        config._setup_logging(force=True)
+        root_logger = logging.getLogger()
+        
+        assert len(root_logger.handlers) == 1
+        assert isinstance(root_logger.handlers[0], logging.handlers.QueueHandler)
+        assert config_module._log_listener is not None
+        assert config_module._log_listener.queue is root_logger.handlers[0].queue
+
+    def test_worker_logging_writes_directly(self):
+        """Test pool workers log without a queue listener, stopping one started in the worker."""
+        config = get_config()
+        config._setup_logging(force=True)
+        listener = config_module._log_listener
+
+        config.setup_worker_logging()
+        root_logger = logging.getLogger()
+        try:
+            assert config_module._log_listener is None
+            assert listener._thread is None
+            assert root_logger.handlers
+            assert not any(
+                isinstance(handler, logging.handlers.QueueHandler) for handler in root_logger.handlers
+            )
+            assert any(isinstance(handler, logging.StreamHandler) for handler in root_logger.handlers)
+        finally:
+            config._setup_logging(force=True)
+
+    def test_worker_logging_drops_inherited_listener(self):
+        """Test a listener copied from a forked parent is dropped without being stopped."""
+        config = get_config()
+        config._setup_logging(force=True)
+        listener = config_module._log_listener
+
+        with patch.object(config_module, "_log_listener_pid", os.getpid() + 1):
+            config.setup_worker_logging()
+        try:
+            assert config_module._log_listener is None
+            assert listener._thread is not None
+        finally:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+            config._setup_logging(force=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,186 @@
+"""
+Unit tests for the ZeroRAG Document Processor.
+
+This module tests the document processor functionality including:
+- CSV conversion with and without pyarrow
+- Chunk caching
+- Parallel and streaming processing
+"""
+
+import pytest
+from unittest.mock import patch
+
+# The services package imports the model services, so it needs src.models
+pytest.importorskip("src.models")
+
+from src.config import get_config
+from src.services.document_processor import DocumentProcessor
+
+
+def chunk_fields(chunks):
+    """Chunk contents and metadata, without the per-run creation time."""
+    return [
+        (
+            chunk.chunk_id, chunk.text, chunk.source_file, chunk.chunk_index, chunk.start_char, chunk.end_char,
+            {key: value for key, value in chunk.metadata.items() if key != "created_at"}
+        )
+        for chunk in chunks
+    ]
+
+
+@pytest.fixture
+def documents(tmp_path):
+    """Text, markdown and CSV documents of different sizes."""
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"notes_{i}.txt"
+        path.write_text(f"Document {i} talks about retrieval. " * (50 * (i + 1)))
+        paths.append(path)
+
+    markdown = tmp_path / "guide.md"
+    markdown.write_text("# Guide\n\nSome **bold** text with a [link](http://example.com).\n" * 40)
+    paths.append(markdown)
+
+    table = tmp_path / "table.csv"
+    table.write_text("name,value\n" + "".join(f"row{i},{i * 1.5}\n" for i in range(60)))
+    paths.append(table)
+    return paths
+
+
+@pytest.fixture
+def processor():
+    """Document processor using the default configuration."""
+    return DocumentProcessor(get_config())
+
+
+class TestCsvProcessing:
+    """Test cases for CSV conversion."""
+
+    def test_arrow_matches_csv_module(self, processor, tmp_path):
+        """Test the pyarrow and csv module paths render the same text."""
+        pytest.importorskip("pyarrow")
+
+        csv_file = tmp_path / "values.csv"
+        csv_file.write_text(
+            "amount,name,count,active,updated,shipped\n"
+            "1e30,alpha,1,True,2024-01-01T10:00:00,2024-01-02T11:30:00+02:00\n"
+            "nan,,2,False,2024-01-01T11:00:00,2024-01-02T12:30:00+02:00\n"
+            "inf,gamma,,True,,2024-01-02T13:30:00+02:00\n"
+            "-inf,NULL,4,,2024-01-01T13:00:00,2024-01-02T14:30:00+02:00\n"
+            ",epsilon,5,False,2024-01-01T14:00:00,2024-01-02T15:30:00+02:00\n"
+            "2.675,zeta,6,True,2024-01-01T15:00:00,2024-01-02T16:30:00+02:00\n"
+            "-0.001,eta,7,False,2024-01-01T16:00:00,2024-01-02T17:30:00+02:00\n"
+        )
+
+        arrow_text = processor._process_csv_file(csv_file)
+        with patch("src.services.document_processor.pa", None):
+            csv_text = processor._process_csv_file(csv_file)
+
+        assert arrow_text == csv_text
+        assert "amount: 1000000000000000019884624838656.00" in arrow_text
+        assert "amount: nan" in arrow_text
+        assert "amount: -inf" in arrow_text
+        assert "name: NULL" in arrow_text
+        assert "Row 2: amount: nan | name: (empty) | count: 2 | active: False" in arrow_text
+        assert "Row 3: amount: inf | name: gamma | count: (empty) | active: True | updated: (empty)" in arrow_text
+        assert "amount: 2.67" in arrow_text
+        assert "Row 7: amount: -0.00 | name: eta" in arrow_text
+        assert "updated: 2024-01-01T10:00:00 | shipped: 2024-01-02T11:30:00+02:00" in arrow_text
+        assert "  - updated: date\n" in arrow_text
+
+    def test_out_of_range_float_falls_back_to_csv_module(self, processor, tmp_path):
+        """Test floats beyond Arrow's decimal range are formatted by the csv module path."""
+        pytest.importorskip("pyarrow")
+
+        csv_file = tmp_path / "values.csv"
+        csv_file.write_text("amount,name\n1e40,alpha\n2.5,beta\n")
+
+        text = processor._process_csv_file(csv_file)
+
+        assert "Row 1: amount: 10000000000000000303786028427003666890752.00 | name: alpha" in text
+        assert "Row 2: amount: 2.50 | name: beta" in text
+
+
+class TestChunkCache:
+    """Test cases for the processed chunk cache."""
+
+    def test_cache_hit_reuses_chunks(self, processor, tmp_path):
+        """Test an unchanged document is served from the cache with fresh run metadata."""
+        document = tmp_path / "notes.txt"
+        document.write_text("The cache keeps recent documents. " * 100)
+
+        first_chunks, _ = processor.process_document(document)
+        first_chunks[0].metadata["annotated"] = True
+
+        with patch.object(DocumentProcessor, "_generate_chunks") as generate_chunks:
+            second_chunks, metadata = processor.process_document(document)
+
+        generate_chunks.assert_not_called()
+        assert metadata.chunk_count == len(first_chunks)
+        assert [chunk.text for chunk in second_chunks] == [chunk.text for chunk in first_chunks]
+        assert "annotated" not in second_chunks[0].metadata
+
+        # Chunks are stamped with the run that returned them
+        created_at = {chunk.metadata["created_at"] for chunk in second_chunks}
+        assert len(created_at) == 1
+        assert created_at != {chunk.metadata["created_at"] for chunk in first_chunks}
+
+    def test_changed_document_is_processed_again(self, processor, tmp_path):
+        """Test editing a document invalidates its cached chunks."""
+        document = tmp_path / "notes.txt"
+        document.write_text("The first version of the document. " * 100)
+        processor.process_document(document)
+
+        document.write_text("The second version of the document. " * 100)
+        chunks, _ = processor.process_document(document)
+
+        assert all("second version" in chunk.text for chunk in chunks)
+        assert len(processor._chunk_cache) == 2
+
+
+class TestParallelProcessing:
+    """Test cases for processing documents in worker processes."""
+
+    def test_pooled_results_match_sequential(self, processor, documents):
+        """Test worker processes produce the same chunks and metadata, in input order."""
+        sequential = [processor.process_document(path) for path in documents]
+        pooled = list(processor.process_documents(documents, max_workers=2))
+
+        assert len(pooled) == len(sequential)
+        for (chunks, metadata), (expected_chunks, expected_metadata) in zip(pooled, sequential):
+            assert metadata.file_name == expected_metadata.file_name
+            assert metadata.content_hash == expected_metadata.content_hash
+            assert metadata.chunk_count == expected_metadata.chunk_count
+            assert chunk_fields(chunks) == chunk_fields(expected_chunks)
+
+    def test_chunksize_does_not_change_results(self, processor, documents):
+        """Test batching documents per task keeps the results and their order."""
+        one_per_task = list(processor.process_documents(documents, max_workers=2, chunksize=1))
+        batched = list(processor.process_documents(documents, max_workers=2, chunksize=4))
+
+        assert [chunk_fields(chunks) for chunks, _ in batched] == [
+            chunk_fields(chunks) for chunks, _ in one_per_task
+        ]
+
+    def test_failed_document_is_skipped(self, processor, documents, tmp_path):
+        """Test a failing document is reported without stopping the others."""
+        empty = tmp_path / "empty.txt"
+        empty.write_text("")
+        paths = [documents[0], empty, documents[1]]
+
+        results = list(processor.process_documents(paths, max_workers=2))
+
+        assert [metadata.file_name for _, metadata in results] == [documents[0].name, documents[1].name]
+        assert processor.get_processing_metrics()["errors"]
+
+
+class TestStreamingProcessing:
+    """Test cases for streaming a document's chunks."""
+
+    def test_streamed_chunks_match_processed_chunks(self, processor, documents):
+        """Test streaming yields the chunks process_document returns."""
+        for path in documents:
+            expected_chunks, _ = processor.process_document(path)
+            streamed = processor.process_document_streaming(path)
+
+            assert chunk_fields(list(streamed)) == chunk_fields(expected_chunks)
@@ -0,0 +1,234 @@
+"""
+Unit tests for the ZeroRAG Health Monitor.
+
+This module tests the health monitor functionality including:
+- Alert dispatch to callbacks
+- Alert batching
+- Health check caching
+- Health trends
+"""
+
+import queue
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+
+# The services package imports the model services, so it needs src.models
+pytest.importorskip("src.models")
+
+from src.services.health_monitor import (
+    _ALERT_BATCH_THRESHOLD, _HEALTH_CHECK_TTL, AlertLevel, HealthMonitor
+)
+
+
+def make_health_status(**statuses):
+    """Build a service factory health check result from service statuses."""
+    return {
+        "overall_status": "healthy" if all(s == "healthy" for s in statuses.values()) else "unhealthy",
+        "services": {
+            name: {"status": status, "health_data": {}, "last_check": 0, "error_count": 0}
+            for name, status in statuses.items()
+        },
+        "metrics": {"total_requests": 0},
+        "healthy_services": [name for name, status in statuses.items() if status == "healthy"],
+        "timestamp": time.time()
+    }
+
+
+@pytest.fixture
+def monitor():
+    """Health monitor over a mocked service factory."""
+    service_factory = Mock()
+    service_factory.perform_health_check.return_value = make_health_status(llm="healthy")
+    monitor = HealthMonitor(service_factory, check_interval=30, alert_threshold=3)
+    yield monitor
+    monitor._stop_alert_dispatcher()
+
+
+def run_check(monitor, **statuses):
+    """Run one monitor check against the given service statuses."""
+    monitor.service_factory.perform_health_check.return_value = make_health_status(**statuses)
+    monitor._health_check_cache = None
+    monitor._perform_health_check()
+
+
+class TestAlertDispatch:
+    """Test cases for alert callbacks."""
+
+    def test_callbacks_receive_alerts(self, monitor):
+        """Test alerts reach the callbacks on the dispatcher thread."""
+        received = []
+        monitor.add_alert_callback(received.append)
+
+        monitor._create_alert(AlertLevel.WARNING, "llm", "Service llm is unhealthy", {})
+        monitor._stop_alert_dispatcher()
+
+        assert [alert.message for alert in received] == ["Service llm is unhealthy"]
+
+    def test_stop_does_not_deadlock_on_full_queue(self, monitor):
+        """Test stopping while the queue is full and a callback raises an alert."""
+        in_callback = threading.Event()
+        proceed = threading.Event()
+
+        def callback(alert):
+            if alert.service_name == "first":
+                in_callback.set()
+                proceed.wait(5)
+                monitor._create_alert(AlertLevel.INFO, "nested", "Raised from a callback", {})
+
+        monitor.add_alert_callback(callback)
+        monitor._alert_queue = queue.Queue(maxsize=1)
+
+        monitor._create_alert(AlertLevel.INFO, "first", "First alert", {})
+        assert in_callback.wait(2)
+        monitor._create_alert(AlertLevel.INFO, "second", "Fills the queue", {})
+
+        stopper = threading.Thread(target=monitor._stop_alert_dispatcher, daemon=True)
+        stopper.start()
+        time.sleep(0.1)
+        proceed.set()
+
+        stopper.join(timeout=3)
+        assert not stopper.is_alive()
+
+
+class TestAlertBatching:
+    """Test cases for batching alerts raised by one check."""
+
+    def test_alerts_below_threshold_are_sent_individually(self, monitor):
+        """Test a few failing services each notify the callbacks."""
+        received = []
+        monitor.add_alert_callback(received.append)
+
+        unhealthy = {f"service_{i}": "unhealthy" for i in range(_ALERT_BATCH_THRESHOLD)}
+        run_check(monitor, **unhealthy)
+        monitor._stop_alert_dispatcher()
+
+        assert [alert.service_name for alert in received] == list(unhealthy)
+        assert len(monitor.get_alerts()) == _ALERT_BATCH_THRESHOLD
+
+    def test_alerts_above_threshold_are_batched(self, monitor):
+        """Test many failing services notify the callbacks once."""
+        received = []
+        monitor.add_alert_callback(received.append)
+
+        unhealthy = {f"service_{i}": "unhealthy" for i in range(_ALERT_BATCH_THRESHOLD + 2)}
+        run_check(monitor, **unhealthy, llm="error")
+        monitor._stop_alert_dispatcher()
+
+        assert len(received) == 1
+        summary = received[0]
+        assert summary.service_name == "multiple_services"
+        assert summary.level == AlertLevel.WARNING
+        assert summary.details["services"] == [*unhealthy, "llm"]
+
+        # Every service's alert is still recorded
+        alerts = monitor.get_alerts()
+        assert len(alerts) == len(unhealthy) + 2
+        assert {alert.service_name for alert in alerts} == {*unhealthy, "llm", "multiple_services"}
+
+    def test_batch_uses_most_severe_level(self, monitor):
+        """Test the summary alert takes the highest level in the batch."""
+        received = []
+        monitor.add_alert_callback(received.append)
+
+        services = {f"service_{i}": "unhealthy" for i in range(_ALERT_BATCH_THRESHOLD + 1)}
+        for _ in range(monitor.alert_threshold - 1):
+            run_check(monitor, **services)
+        monitor.enable_auto_recovery = False
+        services.update({f"new_{i}": "unhealthy" for i in range(_ALERT_BATCH_THRESHOLD + 1)})
+        run_check(monitor, **services)
+        monitor._stop_alert_dispatcher()
+
+        assert received[-1].service_name == "multiple_services"
+        assert received[-1].level == AlertLevel.ERROR
+
+
+class TestHealthCheckCache:
+    """Test cases for reusing recent health checks."""
+
+    def test_check_is_reused_within_ttl(self, monitor):
+        """Test the service factory is probed once per TTL."""
+        factory = monitor.service_factory
+
+        monitor._cached_perform_health_check()
+        monitor._cached_perform_health_check()
+        assert factory.perform_health_check.call_count == 1
+
+        # Age the cached result past the TTL
+        checked_at, health_status = monitor._health_check_cache
+        monitor._health_check_cache = (checked_at - _HEALTH_CHECK_TTL, health_status)
+
+        monitor._cached_perform_health_check()
+        assert factory.perform_health_check.call_count == 2
+
+    def test_summary_reuses_fresh_record(self, monitor):
+        """Test the summary reports the last check while it is recent."""
+        run_check(monitor, llm="unhealthy")
+        monitor._health_check_cache = None
+        factory = monitor.service_factory
+        factory.perform_health_check.reset_mock()
+        factory.perform_health_check.return_value = make_health_status(llm="healthy")
+
+        summary = monitor.get_health_summary()
+
+        factory.perform_health_check.assert_not_called()
+        assert summary["current_health"]["overall_status"] == "unhealthy"
+
+    def test_summary_probes_after_record_expires(self, monitor):
+        """Test the summary probes the services once the last check is too old."""
+        monitor.service_factory.perform_health_check.return_value = make_health_status(llm="unhealthy")
+        monitor._perform_health_check(time.time() - monitor.check_interval - 1)
+        monitor._health_check_cache = None
+        factory = monitor.service_factory
+        factory.perform_health_check.reset_mock()
+        factory.perform_health_check.return_value = make_health_status(llm="healthy")
+
+        summary = monitor.get_health_summary()
+
+        factory.perform_health_check.assert_called_once()
+        assert summary["current_health"]["overall_status"] == "healthy"
+
+
+class TestHealthTrend:
+    """Test cases for the health trend of recent checks."""
+
+    def test_trend_labels(self, monitor):
+        """Test the trend follows the recent healthy and unhealthy checks."""
+        run_check(monitor, llm="healthy")
+        assert monitor.get_health_summary()["health_trend"] == {"trend": "insufficient_data"}
+
+        run_check(monitor, llm="healthy")
+        assert monitor.get_health_summary()["health_trend"]["trend"] == "stable_healthy"
+
+        run_check(monitor, llm="unhealthy")
+        assert monitor.get_health_summary()["health_trend"]["trend"] == "improving"
+
+        run_check(monitor, llm="unhealthy")
+        run_check(monitor, llm="unhealthy")
+        trend = monitor.get_health_summary()["health_trend"]
+        assert trend == {
+            "trend": "declining",
+            "healthy_checks": 2,
+            "unhealthy_checks": 3,
+            "total_checks": 5
+        }
+
+    def test_trend_window_keeps_last_ten_checks(self, monitor):
+        """Test old checks leave the trend window."""
+        run_check(monitor, llm="healthy")
+        for _ in range(10):
+            run_check(monitor, llm="unhealthy")
+
+        trend = monitor.get_health_summary()["health_trend"]
+        assert trend["trend"] == "stable_unhealthy"
+        assert trend["total_checks"] == 10
+
+    def test_trend_label_is_memoized(self):
+        """Test repeated counts reuse the cached trend label."""
+        HealthMonitor._label.cache_clear()
+
+        assert HealthMonitor._label(7, 10) == "improving"
+        assert HealthMonitor._label(7, 10) == "improving"
+        assert HealthMonitor._label.cache_info().hits == 1
@@ -0,0 +1,102 @@
+"""
+Unit tests for the ZeroRAG Service Factory.
+
+This module tests the service factory health checks including:
+- Concurrent service probes
+- Timeouts and hung probes
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+# The services package imports the model services, so it needs src.models
+pytest.importorskip("src.models")
+
+from src.config import get_config
+from src.services.service_factory import ServiceFactory, ServiceInfo, ServiceStatus
+
+
+@pytest.fixture
+def factory():
+    """Service factory with mocked embedding and document processor services."""
+    with patch.object(ServiceFactory, "_initialize_services"):
+        factory = ServiceFactory(get_config())
+
+    factory.embedding_service = Mock()
+    factory.document_processor = Mock()
+    factory.document_processor.health_check.return_value = {"status": "healthy"}
+    for name in ("embedding", "document_processor"):
+        factory.services[name] = ServiceInfo(
+            name=name,
+            status=ServiceStatus.INITIALIZING,
+            health_data={},
+            last_check=time.time(),
+            error_count=0
+        )
+
+    yield factory
+    factory.shutdown()
+
+
+class TestServiceFactoryHealthCheck:
+    """Test cases for service health checks."""
+
+    def test_probes_run_concurrently(self, factory):
+        """Test a check takes as long as the slowest probe."""
+        def slow_probe():
+            time.sleep(0.2)
+            return {"status": "healthy"}
+
+        factory.embedding_service.health_check.side_effect = slow_probe
+        factory.document_processor.health_check.side_effect = slow_probe
+
+        start_time = time.time()
+        health = factory.perform_health_check(timeout=5)
+
+        assert time.time() - start_time < 0.35
+        assert health["services"]["embedding"]["status"] == "healthy"
+        assert health["services"]["document_processor"]["status"] == "healthy"
+
+    def test_hung_probe_is_not_resubmitted(self, factory):
+        """Test a probe still running from an earlier check is reported, not queued again."""
+        release = threading.Event()
+
+        def hung_probe():
+            release.wait(5)
+            return {"status": "healthy"}
+
+        factory.embedding_service.health_check.side_effect = hung_probe
+        try:
+            health = factory.perform_health_check(timeout=0.1)
+            assert health["services"]["embedding"]["status"] == "error"
+            assert health["services"]["embedding"]["health_data"] == {"error": "health check timed out"}
+
+            for _ in range(5):
+                health = factory.perform_health_check(timeout=0.1)
+                assert health["services"]["embedding"]["health_data"] == {
+                    "error": "previous health check still running"
+                }
+                assert health["services"]["document_processor"]["status"] == "healthy"
+
+            assert factory.embedding_service.health_check.call_count == 1
+        finally:
+            release.set()
+
+        # Once the hung probe returns the service is probed again
+        time.sleep(0.1)
+        health = factory.perform_health_check(timeout=1)
+        assert health["services"]["embedding"]["status"] == "healthy"
+        assert factory.embedding_service.health_check.call_count == 2
+
+    def test_dropped_factory_releases_pool(self):
+        """Test a factory dropped without shutdown() stops its health check pool."""
+        with patch.object(ServiceFactory, "_initialize_services"):
+            factory = ServiceFactory(get_config())
+        pool = factory._health_check_pool
+
+        del factory
+
+        with pytest.raises(RuntimeError):
+            pool.submit(lambda: None)